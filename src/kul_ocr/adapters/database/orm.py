@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Dialect,
     Enum,
+    Index,
     Integer,
     MetaData,
     String,
@@ -43,6 +44,8 @@ ocr_jobs = Table(
     Column("started_at", DateTime, nullable=True),
     Column("completed_at", DateTime, nullable=True),
     Column("status", Enum(model.JobStatus), nullable=False),
+    # Serves per-document job lookups, with or without a status filter.
+    Index("ix_ocr_jobs_document_id_status", "document_id", "status"),
 )
 
 
@@ -1,5 +1,5 @@
 import abc
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import final, override
 
 from sqlalchemy import select
@@ -19,6 +19,11 @@ class AbstractDocumentRepository(abc.ABC):
     def add(self, document: model.Document) -> None:
         raise NotImplementedError
 
+    def add_many(self, documents: Iterable[model.Document]) -> None:
+        """Add several entities at once; defaults to one ``add`` per entity."""
+        for document in documents:
+            self.add(document)
+
     @abc.abstractmethod
     def get(self, document_id: str) -> model.Document | None:
         raise NotImplementedError
@@ -35,6 +40,11 @@ class AbstractOCRJobRepository(abc.ABC):
     def add(self, ocr_job: model.Job) -> None:
         raise NotImplementedError
 
+    def add_many(self, ocr_jobs: Iterable[model.Job]) -> None:
+        """Add several entities at once; defaults to one ``add`` per entity."""
+        for ocr_job in ocr_jobs:
+            self.add(ocr_job)
+
     @abc.abstractmethod
     def get(self, ocr_job_id: str) -> model.Job | None:
         raise NotImplementedError
@@ -51,6 +61,12 @@ class AbstractOCRJobRepository(abc.ABC):
     def list_by_document_id(self, document_id: str) -> Sequence[model.Job]:
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def list_by_document_id_and_status(
+        self, document_id: str, job_status: model.JobStatus
+    ) -> Sequence[model.Job]:
+        raise NotImplementedError
+
     @abc.abstractmethod
     def list_terminal_jobs(self) -> Sequence[model.Job]:
         raise NotImplementedError
@@ -67,6 +83,11 @@ class AbstractOCRResultRepository(abc.ABC):
     def add(self, ocr_result: model.Result) -> None:
         raise NotImplementedError
 
+    def add_many(self, ocr_results: Iterable[model.Result]) -> None:
+        """Add several entities at once; defaults to one ``add`` per entity."""
+        for ocr_result in ocr_results:
+            self.add(ocr_result)
+
     @abc.abstractmethod
     def get(self, ocr_result_id: str) -> model.Result | None:
         raise NotImplementedError
@@ -94,6 +115,10 @@ class SQLAlchemyDocumentRepository(AbstractDocumentRepository):
     def add(self, document: model.Document) -> None:
         self._session.add(document)
 
+    @override
+    def add_many(self, documents: Iterable[model.Document]) -> None:
+        self._session.add_all(list(documents))
+
     @override
     def get(self, document_id: str) -> model.Document | None:
         statement = select(model.Document).where(orm.documents.c.id == document_id)
@@ -116,6 +141,10 @@ class SQLAlchemyOcrJobRepository(AbstractOCRJobRepository):
     def add(self, ocr_job: model.Job):
         self._session.add(ocr_job)
 
+    @override
+    def add_many(self, ocr_jobs: Iterable[model.Job]) -> None:
+        self._session.add_all(list(ocr_jobs))
+
     @override
     def get(self, ocr_job_id: str) -> model.Job | None:
         statement = select(model.Job).where(orm.ocr_jobs.c.id == ocr_job_id)
@@ -136,6 +165,16 @@ class SQLAlchemyOcrJobRepository(AbstractOCRJobRepository):
         statement = select(model.Job).where(orm.ocr_jobs.c.document_id == document_id)
         return self._session.scalars(statement).all()
 
+    @override
+    def list_by_document_id_and_status(
+        self, document_id: str, job_status: model.JobStatus
+    ) -> Sequence[model.Job]:
+        statement = select(model.Job).where(
+            orm.ocr_jobs.c.document_id == document_id,
+            orm.ocr_jobs.c.status == job_status,
+        )
+        return self._session.scalars(statement).all()
+
     @override
     def list_terminal_jobs(self) -> Sequence[model.Job]:
         statement = select(model.Job).where(
@@ -168,6 +207,10 @@ class SQLAlchemyOcrResultRepository(AbstractOCRResultRepository):
     def add(self, ocr_result: model.Result) -> None:
         self._session.add(ocr_result)
 
+    @override
+    def add_many(self, ocr_results: Iterable[model.Result]) -> None:
+        self._session.add_all(list(ocr_results))
+
     @override
     def get(self, ocr_result_id: str) -> model.Result | None:
         statement = select(model.Result).where(orm.ocr_results.c.id == ocr_result_id)
@@ -12,6 +12,8 @@ from kul_ocr.domain import exceptions, ports
 
 @final
 class LocalFileStorage(ports.FileStorage):
+    COPY_CHUNK_SIZE = 64 * 1024  # bytes read from the upload stream per write
+
     def _construct_full_path(self, file_path: pathlib.Path) -> pathlib.Path:
         return self.storage_root / file_path
 
@@ -29,7 +31,7 @@ class LocalFileStorage(ports.FileStorage):
 
         try:
             with full_file_path.open("wb") as dest:
-                shutil.copyfileobj(stream, dest)
+                shutil.copyfileobj(stream, dest, length=self.COPY_CHUNK_SIZE)
         except OSError as e:
             raise exceptions.FileUploadError(
                 f"Failed to save file {full_file_path} to the file system: {e}"
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Self
 
 from kul_ocr.domain import exceptions
 
@@ -67,6 +67,11 @@ def wrap_text_in_page_part(
 """
 
 
+def _now() -> datetime:
+    """Current time for entity timestamps, looked up at call time."""
+    return datetime.now()
+
+
 class JobStatus(Enum):
     PENDING = "pending"
     PROCESSING = "processing"
@@ -78,7 +83,7 @@ class JobStatus(Enum):
 class Job:
     id: str
     document_id: str
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=lambda: _now())
     error_message: str | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
@@ -103,7 +108,7 @@ class Job:
             raise exceptions.InvalidJobStatusError(
                 f"Job {self.id} has already been processed. Status is {self.status}"
             )
-        self.started_at = datetime.now()
+        self.started_at = _now()
         self.status = JobStatus.PROCESSING
 
     def complete(self):
@@ -112,7 +117,7 @@ class Job:
                 f"Job {self.id} is not in processing state. Status is {self.status}"
             )
         self.status = JobStatus.COMPLETED
-        self.completed_at = datetime.now()
+        self.completed_at = _now()
 
     def fail(self, error_message: str):
         if self.is_terminal:
@@ -121,7 +126,7 @@ class Job:
             )
         self.status = JobStatus.FAILED
         self.error_message = error_message
-        self.completed_at = datetime.now()
+        self.completed_at = _now()
 
 
 class FileType(Enum):
@@ -149,15 +154,15 @@ class Document:
     id: str
     file_path: str
     file_type: FileType
-    uploaded_at: datetime = field(default_factory=datetime.now)
+    uploaded_at: datetime = field(default_factory=lambda: _now())
     file_size_bytes: int = 0
 
     def __post_init__(self):
         path = Path(self.file_path)
         if self.file_type.dot_extension != path.suffix:
             raise ValueError(
-                f"Document extension mismatch: expected {self.file_type.dot_extension} ",
-                f"but got {path.suffix}",
+                f"Document extension mismatch: expected {self.file_type.dot_extension} "
+                f"but got {path.suffix}"
             )
 
     @property
@@ -196,4 +201,23 @@ class Result:
     id: str
     job_id: str
     content: Sequence[ProcessedPage]
-    creation_time: datetime = field(default_factory=datetime.now)
+    creation_time: datetime = field(default_factory=lambda: _now())
+
+    @classmethod
+    def from_pages(
+        cls, id: str, document_id: str, pages: Sequence[PagePart], job_id: str = ""
+    ) -> Self:
+        """Build a Result whose content references each page by its page number."""
+        return cls(
+            id=id,
+            job_id=job_id,
+            content=[
+                ProcessedPage(
+                    ref=PageRef(
+                        document_id=document_id, index=page.metadata.page_number
+                    ),
+                    result=page,
+                )
+                for page in pages
+            ],
+        )
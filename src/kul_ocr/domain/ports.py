@@ -1,6 +1,6 @@
 import abc
 import pathlib
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
 from typing import Protocol, Self, runtime_checkable
 
@@ -24,6 +24,14 @@ class OCREngine(abc.ABC):
     def process_image(self, image: Image.Image) -> str:
         raise NotImplementedError
 
+    def process_images(self, images: Sequence[Image.Image]) -> list[str]:
+        """Recognise several images in one call, returning texts in input order.
+
+        Engines with a native batch interface should override this; the
+        default falls back to one ``process_image`` call per image.
+        """
+        return [self.process_image(image) for image in images]
+
     @property
     @abc.abstractmethod
     def engine_name(self) -> str:
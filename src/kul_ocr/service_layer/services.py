@@ -1,3 +1,4 @@
+import itertools
 from collections.abc import Iterator, Sequence
 from pathlib import Path
 from uuid import UUID
@@ -7,6 +8,9 @@ from kul_ocr.entrypoints import schemas
 from kul_ocr.service_layer.helpers import generate_id
 from kul_ocr.service_layer.uow import AbstractUnitOfWork
 
+# Upper bound on page images held in memory for one OCR engine call.
+OCR_BATCH_SIZE = 8
+
 
 # --- Document Services ---
 
@@ -155,7 +159,9 @@ def process_document(
     """Processes a document using the provided OCR engine and loader.
 
     Orchestrates the loading of document pages and their processing by the
-    OCR engine. Returns a Result with ProcessedPage objects.
+    OCR engine. Pages are streamed from the loader and sent to the engine in
+    batches of at most OCR_BATCH_SIZE, so only one batch of page images is
+    held in memory at a time. Returns a Result with ProcessedPage objects.
 
     Args:
         doc_input: The document data to process (no ORM dependencies).
@@ -168,32 +174,26 @@ def process_document(
     Raises:
         ValueError: If no content could be loaded from the document.
     """
-    processed_pages: list[model.ProcessedPage] = []
-
-    for page_input in document_loader.load_pages(doc_input):
-        raw_text = ocr_engine.process_image(page_input.image)
-        width, height = page_input.image.size
-
-        page_part = model.wrap_text_in_page_part(
-            text=raw_text,
-            page_number=page_input.page_number,
-            width=width,
-            height=height,
-        )
-
-        processed_page = model.ProcessedPage(
-            ref=model.PageRef(document_id=doc_input.id, index=page_input.page_number),
-            result=page_part,
+    pages: list[model.PagePart] = []
+    for batch in itertools.batched(
+        document_loader.load_pages(doc_input), OCR_BATCH_SIZE
+    ):
+        raw_texts = ocr_engine.process_images([page.image for page in batch])
+        pages.extend(
+            model.wrap_text_in_page_part(
+                text=raw_text,
+                page_number=page_input.page_number,
+                width=page_input.image.width,
+                height=page_input.image.height,
+            )
+            for page_input, raw_text in zip(batch, raw_texts, strict=True)
         )
-        processed_pages.append(processed_page)
 
-    if not processed_pages:
+    if not pages:
         raise ValueError(f"No content could be loaded from document {doc_input.id}")
 
-    return model.Result(
-        id=generate_id(),
-        job_id="",
-        content=processed_pages,
+    return model.Result.from_pages(
+        id=generate_id(), document_id=doc_input.id, pages=pages
     )
 
 
@@ -273,17 +273,20 @@ def get_ocr_jobs(
     """
 
     with uow:
+        job_status: model.JobStatus | None = None
         if status:
             if status not in [status.value for status in model.JobStatus]:
                 raise exceptions.InvalidJobStatusError(f"Invalid status '{status}'")
-
-            jobs = uow.jobs.list_by_status(model.JobStatus(status))
+            job_status = model.JobStatus(status)
+
+        if document_id and job_status:
+            jobs = uow.jobs.list_by_document_id_and_status(str(document_id), job_status)
+        elif document_id:
+            jobs = uow.jobs.list_by_document_id(str(document_id))
+        elif job_status:
+            jobs = uow.jobs.list_by_status(job_status)
         else:
             jobs = uow.jobs.list_all()
-        if document_id:
-            jobs = [
-                j for j in jobs if j.document_id == str(document_id)
-            ]  # [TODO] this asks for trouble
         return schemas.JobListResponse.from_domain(list(jobs))
 
 
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+
+@dataclass
+class FakeClock:
+    """Deterministic stand-in for ``datetime`` that advances on every reading."""
+
+    start: datetime = datetime(2024, 1, 1)
+    step: timedelta = timedelta(seconds=1)
+    readings: int = 0
+
+    def now(self) -> datetime:
+        reading = self.at(self.readings)
+        self.readings += 1
+        return reading
+
+    def at(self, reading: int) -> datetime:
+        """Timestamp returned by the ``reading``-th call to ``now``."""
+        return self.start + self.step * reading
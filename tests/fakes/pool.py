@@ -0,0 +1,46 @@
+"""Cheap copies of cached domain templates for tests that only need *some* entity.
+
+Each template is built once through ``tests.factories`` and handed out via
+``dataclasses.replace`` with a fresh id, so callers can mutate their copy
+freely. Ids come from a pre-generated pool instead of one ``uuid4()`` per call.
+"""
+
+import dataclasses
+import uuid
+from functools import lru_cache
+from pathlib import Path
+
+from kul_ocr.domain import model
+from tests import factories
+
+_ID_BATCH_SIZE = 256
+_ids: list[str] = []
+
+
+def next_id() -> str:
+    """Next unused id from the pool, refilled in batches when it runs dry."""
+    if not _ids:
+        _ids.extend(str(uuid.uuid4()) for _ in range(_ID_BATCH_SIZE))
+    return _ids.pop()
+
+
+@lru_cache(maxsize=128)
+def _template_document(file_type: model.FileType) -> model.Document:
+    return factories.generate_document(dir_path=Path("/tmp"), file_type=file_type)
+
+
+@lru_cache(maxsize=128)
+def _template_job(status: model.JobStatus) -> model.Job:
+    return factories.generate_ocr_job(status=status)
+
+
+def pooled_document(file_type: model.FileType = model.FileType.PDF) -> model.Document:
+    return dataclasses.replace(_template_document(file_type), id=next_id())
+
+
+def pooled_job(
+    status: model.JobStatus = model.JobStatus.PENDING, document_id: str | None = None
+) -> model.Job:
+    return dataclasses.replace(
+        _template_job(status), id=next_id(), document_id=document_id or next_id()
+    )
@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import final, override
 
 from kul_ocr.adapters.database.repository import (
@@ -24,6 +24,17 @@ class FakeDocumentRepository(AbstractDocumentRepository):
     def get(self, document_id: str) -> model.Document | None:
         return self._documents.get(document_id)
 
+    def reset(self) -> None:
+        self._documents.clear()
+        self.added.clear()
+
+    @override
+    def add_many(self, documents: Iterable[model.Document]) -> None:
+        """``add`` for several entities at once; each is recorded in ``added``."""
+        items = list(documents)
+        self._documents.update((item.id, item) for item in items)
+        self.added.extend(items)
+
     @override
     def list_all(self) -> Sequence[model.Document]:
         return list(self._documents.values())
@@ -44,6 +55,17 @@ class FakeOcrJobRepository(AbstractOCRJobRepository):
     def get(self, ocr_job_id: str) -> model.Job | None:
         return self._jobs.get(ocr_job_id)
 
+    def reset(self) -> None:
+        self._jobs.clear()
+        self.added.clear()
+
+    @override
+    def add_many(self, ocr_jobs: Iterable[model.Job]) -> None:
+        """``add`` for several entities at once; each is recorded in ``added``."""
+        items = list(ocr_jobs)
+        self._jobs.update((item.id, item) for item in items)
+        self.added.extend(items)
+
     @override
     def list_all(self) -> Sequence[model.Job]:
         return list(self._jobs.values())
@@ -56,6 +78,16 @@ class FakeOcrJobRepository(AbstractOCRJobRepository):
     def list_by_document_id(self, document_id: str) -> Sequence[model.Job]:
         return [j for j in self._jobs.values() if j.document_id == document_id]
 
+    @override
+    def list_by_document_id_and_status(
+        self, document_id: str, job_status: model.JobStatus
+    ) -> Sequence[model.Job]:
+        return [
+            j
+            for j in self._jobs.values()
+            if j.document_id == document_id and j.status == job_status
+        ]
+
     @override
     def list_terminal_jobs(self) -> Sequence[model.Job]:
         return [j for j in self._jobs.values() if j.is_terminal]
@@ -87,6 +119,17 @@ class FakeOcrResultRepository(AbstractOCRResultRepository):
     def get(self, ocr_result_id: str) -> model.Result | None:
         return self._results.get(ocr_result_id)
 
+    def reset(self) -> None:
+        self._results.clear()
+        self.added.clear()
+
+    @override
+    def add_many(self, ocr_results: Iterable[model.Result]) -> None:
+        """``add`` for several entities at once; each is recorded in ``added``."""
+        items = list(ocr_results)
+        self._results.update((item.id, item) for item in items)
+        self.added.extend(items)
+
     @override
     def list_all(self) -> Sequence[model.Result]:
         return list(self._results.values())
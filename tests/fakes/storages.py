@@ -41,3 +41,7 @@ class FakeFileStorage(ports.FileStorage):
     @property
     def save_call_count(self) -> int:
         return len(self.files)
+
+    def reset(self) -> None:
+        """Forget every stored file, so one instance can serve many tests."""
+        self.files.clear()
@@ -12,6 +12,13 @@ class FakeUnitOfWork(AbstractUnitOfWork):
         self.results = repositories.FakeOcrResultRepository()
         self.committed: bool = False
 
+    def reset(self) -> None:
+        """Empty every repository and clear the commit flag."""
+        self.jobs.reset()
+        self.documents.reset()
+        self.results.reset()
+        self.committed = False
+
     @override
     def rollback(self):
         pass
@@ -41,8 +41,7 @@ def test_can_list_all_documents(uow: SqlAlchemyUnitOfWork):
     ]
 
     with uow:
-        for doc in documents:
-            uow.documents.add(doc)
+        uow.documents.add_many(documents)
         uow.commit()
 
     # Retrieve in a new transaction
@@ -87,8 +86,7 @@ def test_document_persists_different_file_types(uow: SqlAlchemyUnitOfWork):
     ]
 
     with uow:
-        for doc in documents:
-            uow.documents.add(doc)
+        uow.documents.add_many(documents)
         uow.commit()
 
     # Verify each document
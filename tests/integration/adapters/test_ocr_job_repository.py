@@ -50,8 +50,7 @@ def test_can_list_all_jobs(uow: SqlAlchemyUnitOfWork, document_id: str):
     ]
 
     with uow:
-        for job in jobs:
-            uow.jobs.add(job)
+        uow.jobs.add_many(jobs)
         uow.commit()
 
     # Retrieve in a new transaction
@@ -78,8 +77,7 @@ def test_can_list_jobs_by_status(uow: SqlAlchemyUnitOfWork, document_id: str):
             )
 
     with uow:
-        for job in all_jobs:
-            uow.jobs.add(job)
+        uow.jobs.add_many(all_jobs)
         uow.commit()
 
     # Test each status
@@ -122,8 +120,7 @@ def test_can_list_jobs_by_document_id(uow: SqlAlchemyUnitOfWork):
     with uow:
         uow.documents.add(doc1)
         uow.documents.add(doc2)
-        for job in jobs_doc1 + jobs_doc2:
-            uow.jobs.add(job)
+        uow.jobs.add_many(jobs_doc1 + jobs_doc2)
         uow.commit()
 
     # Test filtering by document ID
@@ -137,6 +134,28 @@ def test_can_list_jobs_by_document_id(uow: SqlAlchemyUnitOfWork):
         assert all(job.document_id == doc2_id for job in jobs_for_doc2)
 
 
+def test_can_list_jobs_by_document_id_and_status(
+    uow: SqlAlchemyUnitOfWork, document_id: str
+):
+    """Test listing OCR jobs filtered by both document ID and status"""
+    pending_id = generate_id()
+    pending = Job(id=pending_id, document_id=document_id, status=JobStatus.PENDING)
+    completed = Job(
+        id=generate_id(), document_id=document_id, status=JobStatus.COMPLETED
+    )
+    other_document = Job(
+        id=generate_id(), document_id=generate_id(), status=JobStatus.PENDING
+    )
+
+    with uow:
+        uow.jobs.add_many([pending, completed, other_document])
+        uow.commit()
+
+    with uow:
+        jobs = uow.jobs.list_by_document_id_and_status(document_id, JobStatus.PENDING)
+        assert [job.id for job in jobs] == [pending_id]
+
+
 def test_can_list_terminal_jobs(uow: SqlAlchemyUnitOfWork, document_id: str):
     """Test listing terminal jobs (COMPLETED or FAILED)"""
     jobs = [
@@ -148,8 +167,7 @@ def test_can_list_terminal_jobs(uow: SqlAlchemyUnitOfWork, document_id: str):
     ]
 
     with uow:
-        for job in jobs:
-            uow.jobs.add(job)
+        uow.jobs.add_many(jobs)
         uow.commit()
 
     # Retrieve terminal jobs
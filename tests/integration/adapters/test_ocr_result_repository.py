@@ -105,8 +105,7 @@ def test_can_list_all_results(uow: SqlAlchemyUnitOfWork, job_id: str):
     ]
 
     with uow:
-        for result in results:
-            uow.results.add(result)
+        uow.results.add_many(results)
         uow.commit()
 
     # Retrieve in a new transaction
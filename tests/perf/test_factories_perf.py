@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from tests import factories
+
+_JOBS_COUNT = 1000
+_DOCS_DIR = Path("/fake/docs")
+
+
+@pytest.mark.benchmark(group="factory-jobs", max_time=1.0)
+def test_generate_ocr_jobs_perf(benchmark):
+    jobs = benchmark(factories.generate_ocr_jobs, _JOBS_COUNT)
+
+    assert len(jobs) == _JOBS_COUNT
+
+
+@pytest.mark.benchmark(group="factory", min_rounds=100, max_time=1.0)
+@pytest.mark.parametrize(
+    "factory,kwargs",
+    [
+        pytest.param(factories.generate_ocr_job, {}, id="ocr_job"),
+        pytest.param(factories.generate_ocr_jobs, {"jobs_count": 100}, id="ocr_jobs"),
+        pytest.param(
+            factories.generate_document, {"dir_path": _DOCS_DIR}, id="document"
+        ),
+        pytest.param(
+            factories.generate_documents,
+            {"dir_path": _DOCS_DIR, "documents_count": 100},
+            id="documents",
+        ),
+        pytest.param(factories.generate_text_part, {}, id="text_part"),
+        pytest.param(factories.generate_page_part, {}, id="page_part"),
+        pytest.param(factories.generate_processed_page, {}, id="processed_page"),
+        pytest.param(
+            factories.generate_ocr_result, {"pages_count": 5}, id="ocr_result"
+        ),
+        pytest.param(
+            factories.generate_ocr_results, {"results_count": 10}, id="ocr_results"
+        ),
+    ],
+)
+def test_factory_perf(benchmark, factory, kwargs):
+    assert benchmark(factory, **kwargs) is not None
@@ -0,0 +1,31 @@
+import pytest
+
+from kul_ocr.domain.model import Job
+
+
+def _run_job_lifecycle() -> Job:
+    job = Job(id="job", document_id="doc")
+    job.mark_as_processing()
+    job.complete()
+    return job
+
+
+def _run_job_failure() -> Job:
+    job = Job(id="job", document_id="doc")
+    job.mark_as_processing()
+    job.fail("boom")
+    return job
+
+
+@pytest.mark.benchmark(group="job", min_rounds=1000, max_time=1.0)
+def test_job_lifecycle_perf(benchmark):
+    job = benchmark(_run_job_lifecycle)
+
+    assert job.is_terminal
+
+
+@pytest.mark.benchmark(group="job", min_rounds=1000, max_time=1.0)
+def test_job_failure_perf(benchmark):
+    job = benchmark(_run_job_failure)
+
+    assert job.is_terminal
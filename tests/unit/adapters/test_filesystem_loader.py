@@ -9,6 +9,16 @@ from kul_ocr.domain import model, structs
 from tests.fakes.storages import FakeFileStorage
 
 
+def _encode_image(size: tuple[int, int], color: str, format: str) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, color=color).save(buf, format=format)
+    return buf.getvalue()
+
+
+_BLUE_PNG = _encode_image((50, 50), "blue", "PNG")
+_BLUE_JPEG = _encode_image((50, 50), "blue", "JPEG")
+
+
 @pytest.fixture
 def fake_storage() -> FakeFileStorage:
     return FakeFileStorage()
@@ -28,7 +38,7 @@ def image_bytes() -> bytes:
     return buf.getvalue()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pdf_bytes() -> bytes:
     """Create a simple test PDF with 2 pages as bytes."""
     import pymupdf
@@ -128,21 +138,18 @@ class TestFileSystemDocumentLoader:
         assert hasattr(pages_iterator, "__next__")
 
     @pytest.mark.parametrize(
-        "file_type,format", [(model.FileType.PNG, "PNG"), (model.FileType.JPEG, "JPEG")]
+        "file_type,image_bytes",
+        [(model.FileType.PNG, _BLUE_PNG), (model.FileType.JPEG, _BLUE_JPEG)],
+        ids=["png", "jpeg"],
     )
     def test_load_different_image_formats(
         self,
         loader: FileSystemDocumentLoader,
         fake_storage: FakeFileStorage,
         file_type: model.FileType,
-        format: str,
+        image_bytes: bytes,
     ):
         """Test loading different image formats."""
-        img = Image.new("RGB", (50, 50), color="blue")
-        buf = io.BytesIO()
-        img.save(buf, format=format)
-        image_bytes = buf.getvalue()
-
         file_path = Path(f"test{file_type.dot_extension}")
         fake_storage.save(stream=io.BytesIO(image_bytes), file_path=file_path)
 
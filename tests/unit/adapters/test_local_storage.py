@@ -4,6 +4,61 @@ from pathlib import Path
 import pytest
 
 from kul_ocr.adapters.storages.local import LocalFileStorage
+from kul_ocr.domain import ports
+from tests.fakes.storages import FakeFileStorage
+
+
+@pytest.fixture(params=["local", "fake"])
+def file_storage(request: pytest.FixtureRequest) -> ports.FileStorage:
+    """Each FileStorage implementation the storage contract is checked against."""
+    if request.param == "local":
+        tmp_path: Path = request.getfixturevalue("tmp_path")
+        return LocalFileStorage(storage_root=tmp_path)
+    return FakeFileStorage()
+
+
+class TestFileStorageContract:
+    """Stream-handling behaviour shared by every FileStorage implementation."""
+
+    def _read_back(self, storage: ports.FileStorage, file_path: Path) -> bytes:
+        with storage.load(file_path) as file:
+            return file.read()
+
+    def test_save_then_load_returns_content(self, file_storage: ports.FileStorage):
+        file_storage.save(io.BytesIO(b"Some content"), Path("test_file.txt"))
+
+        assert self._read_back(file_storage, Path("test_file.txt")) == b"Some content"
+
+    def test_save_overwrites_existing_file(self, file_storage: ports.FileStorage):
+        file_path = Path("test_file.txt")
+        file_storage.save(io.BytesIO(b"Original content"), file_path)
+
+        file_storage.save(io.BytesIO(b"New content"), file_path)
+
+        assert self._read_back(file_storage, file_path) == b"New content"
+
+    def test_save_with_empty_stream(self, file_storage: ports.FileStorage):
+        file_path = Path("empty_file.txt")
+
+        file_storage.save(io.BytesIO(b""), file_path)
+
+        assert self._read_back(file_storage, file_path) == b""
+
+    def test_save_with_binary_content(self, file_storage: ports.FileStorage):
+        file_path = Path("binary_file.bin")
+        binary_content = bytes(range(256))
+
+        file_storage.save(io.BytesIO(binary_content), file_path)
+
+        assert self._read_back(file_storage, file_path) == binary_content
+
+    def test_save_stream_position_after_save(self, file_storage: ports.FileStorage):
+        stream = io.BytesIO(b"Hello, World! This is a test file.")
+
+        file_storage.save(stream, Path("test_file.txt"))
+
+        # Stream position should be at the end after save
+        assert stream.tell() == len(stream.getvalue())
 
 
 class TestLocalFileStorage:
@@ -69,32 +124,9 @@ class TestLocalFileStorage:
 
         assert nested_path.exists()
 
-    def test_save_overwrites_existing_file(
-        self, storage: LocalFileStorage, tmp_path: Path
-    ):
-        file_path = tmp_path / "test_file.txt"
-        file_path.write_text("Original content")
-
-        new_content = b"New content"
-        new_stream = io.BytesIO(new_content)
-        storage.save(new_stream, file_path)
-
-        with file_path.open("rb") as f:
-            saved_content = f.read()
-        assert saved_content == new_content
-
-    def test_save_with_empty_stream(self, storage: LocalFileStorage, tmp_path: Path):
-        file_path = tmp_path / "empty_file.txt"
-        empty_stream = io.BytesIO(b"")
-
-        storage.save(empty_stream, file_path)
-
-        assert file_path.exists()
-        assert file_path.stat().st_size == 0
-
     def test_save_with_large_file(self, storage: LocalFileStorage, tmp_path: Path):
         file_path = tmp_path / "large_file.bin"
-        large_content = b"X" * (10 * 1024 * 1024)  # 10 MB
+        large_content = b"X" * (256 * 1024)  # spans several copyfileobj chunks
         large_stream = io.BytesIO(large_content)
 
         storage.save(large_stream, file_path)
@@ -102,26 +134,29 @@ class TestLocalFileStorage:
         assert file_path.exists()
         assert file_path.stat().st_size == len(large_content)
 
-    def test_save_stream_position_after_save(
-        self, storage: LocalFileStorage, sample_stream: io.BytesIO, tmp_path: Path
+    def test_save_copies_in_fixed_size_chunks(
+        self, storage: LocalFileStorage, tmp_path: Path
     ):
-        file_path = tmp_path / "test_file.txt"
+        read_sizes: list[int] = []
 
-        storage.save(sample_stream, file_path)
+        class RecordingStream(io.BytesIO):
+            def read(self, size: int | None = -1, /) -> bytes:
+                read_sizes.append(-1 if size is None else size)
+                return super().read(size)
 
-        # Stream position should be at the end after save
-        assert sample_stream.tell() == len(sample_stream.getvalue())
+        content = b"X" * (3 * LocalFileStorage.COPY_CHUNK_SIZE)
+        storage.save(RecordingStream(content), tmp_path / "chunked.bin")
 
-    def test_save_with_binary_content(self, storage: LocalFileStorage, tmp_path: Path):
-        file_path = tmp_path / "binary_file.bin"
-        binary_content = bytes(range(256))
-        binary_stream = io.BytesIO(binary_content)
+        assert set(read_sizes) == {LocalFileStorage.COPY_CHUNK_SIZE}
 
-        storage.save(binary_stream, file_path)
+    def test_save_from_open_file(self, storage: LocalFileStorage, tmp_path: Path):
+        source = tmp_path / "upload.pdf"
+        source.write_bytes(b"%PDF-1.4 streamed from disk")
 
-        with file_path.open("rb") as f:
-            saved_content = f.read()
-        assert saved_content == binary_content
+        with source.open("rb") as stream:
+            storage.save(stream, Path("stored.pdf"))
+
+        assert (storage.storage_root / "stored.pdf").read_bytes() == source.read_bytes()
 
     def test_load_reads_file(self, storage: LocalFileStorage, storage_root: Path):
         """Test that load method reads file content correctly."""
@@ -117,3 +117,19 @@ class TestTesseractOCREngine:
 
         mock_pytesseract.image_to_string.assert_called_once_with(image=sample_image)
         assert result == expected_text
+
+    @patch("kul_ocr.adapters.ocr.tesseract.pytesseract")
+    def test_process_images_returns_texts_in_order(
+        self,
+        mock_pytesseract,
+        config: TesseractEngineConfig,
+        sample_image: Image.Image,
+    ):
+        mock_pytesseract.get_tesseract_version.return_value = "5.0.0"
+        mock_pytesseract.image_to_string.side_effect = ["page 1", "page 2"]
+
+        engine = TesseractOCREngine(config)
+        result = engine.process_images([sample_image, sample_image])
+
+        assert result == ["page 1", "page 2"]
+        assert mock_pytesseract.image_to_string.call_count == 2
@@ -22,8 +22,20 @@ def ocr_job():
 
 
 @pytest.fixture
-def document(tmp_path: Path):
-    return factories.generate_document(dir_path=tmp_path)
+def ocr_result(request: pytest.FixtureRequest):
+    """OCR result; parametrize indirectly with a page count to fix its length."""
+    return factories.generate_ocr_result(pages_count=getattr(request, "param", None))
+
+
+@pytest.fixture(scope="session")
+def fake_dir() -> Path:
+    """Directory prefix for document factories; it never exists on disk."""
+    return Path("/fake/docs")
+
+
+@pytest.fixture
+def document(fake_dir: Path):
+    return factories.generate_document(dir_path=fake_dir)
 
 
 @pytest.fixture
@@ -0,0 +1,100 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from kul_ocr.domain import model
+from kul_ocr.domain.model import (
+    BoundingBox,
+    Document,
+    FileType,
+    PageMetadata,
+    PagePart,
+    PageRef,
+    ProcessedPage,
+    TextPart,
+)
+from tests.fakes.clock import FakeClock
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the clock behind domain entity timestamps with a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr(model, "_now", clock.now)
+    return clock
+
+
+@pytest.fixture(scope="module")
+def sample_docs() -> dict[FileType, Document]:
+    """One document per file type, shared by tests that only read them."""
+    return {
+        file_type: Document(
+            id=f"doc-{file_type.extension}",
+            file_path=f"/test{file_type.dot_extension}",
+            file_type=file_type,
+        )
+        for file_type in FileType
+    }
+
+
+# Shared value objects. Their dataclasses are frozen, so handing one instance
+# to every test in the session is safe.
+
+
+@pytest.fixture(scope="session")
+def default_bbox() -> BoundingBox:
+    return BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
+
+
+@pytest.fixture(scope="session")
+def default_text_part(default_bbox: BoundingBox) -> TextPart:
+    return TextPart(text="Hello", bbox=default_bbox)
+
+
+@pytest.fixture(scope="session")
+def default_metadata() -> PageMetadata:
+    return PageMetadata(page_number=1, width=1000, height=1200)
+
+
+@pytest.fixture(scope="session")
+def default_page_part(
+    default_text_part: TextPart, default_metadata: PageMetadata
+) -> PagePart:
+    return PagePart(parts=[default_text_part], metadata=default_metadata)
+
+
+@pytest.fixture(scope="session")
+def default_ref() -> PageRef:
+    return PageRef(document_id="doc-123", index=0)
+
+
+@pytest.fixture(scope="session")
+def default_processed_page(
+    default_ref: PageRef, default_page_part: PagePart
+) -> ProcessedPage:
+    return ProcessedPage(ref=default_ref, result=default_page_part)
+
+
+@pytest.fixture(scope="session")
+def make_text_part(default_bbox: BoundingBox) -> Callable[..., TextPart]:
+    """Build a TextPart variant, reusing the default bounding box."""
+
+    def _make(text: str, **overrides: Any) -> TextPart:
+        return TextPart(text=text, **{"bbox": default_bbox, **overrides})
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def three_text_parts() -> list[TextPart]:
+    """Three side-by-side lines, "Line 0" to "Line 2"."""
+    return [
+        TextPart(
+            text=f"Line {i}",
+            bbox=BoundingBox(
+                x_min=i * 10.0, y_min=0.0, x_max=(i + 1) * 10.0, y_max=20.0
+            ),
+        )
+        for i in range(3)
+    ]
@@ -1,19 +1,31 @@
-import time
+import re
 
+import pytest
 
 from kul_ocr.domain.model import Document, FileType
+from tests.fakes.clock import FakeClock
 
+pytestmark = pytest.mark.xdist_group(name="domain_pure")
+
+LARGE_FILE_BYTES: int = 1_000_000_000
 
-class TestFileType:
-    def test_file_type_extension(self):
-        assert FileType.PDF.dot_extension == ".pdf"
-        assert FileType.PNG.dot_extension == ".png"
-        assert FileType.JPG.dot_extension == ".jpg"
 
-    def test_file_type_is_image(self):
-        assert FileType.PNG.is_image
-        assert FileType.JPG.is_image
-        assert not FileType.PDF.is_image
+class TestFileType:
+    @pytest.mark.parametrize(
+        "member,attr,expected",
+        [
+            pytest.param(FileType.PDF, "extension", "pdf", id="pdf-extension"),
+            pytest.param(FileType.PDF, "dot_extension", ".pdf", id="pdf-dot"),
+            pytest.param(FileType.PNG, "dot_extension", ".png", id="png-dot"),
+            pytest.param(FileType.JPG, "dot_extension", ".jpg", id="jpg-dot"),
+            pytest.param(FileType.PDF, "is_image", False, id="pdf-not-image"),
+            pytest.param(FileType.PNG, "is_image", True, id="png-image"),
+            pytest.param(FileType.JPG, "is_image", True, id="jpg-image"),
+            pytest.param(FileType.WEBP, "is_image", True, id="webp-image"),
+        ],
+    )
+    def test_file_type_attributes(self, member: FileType, attr: str, expected: object):
+        assert getattr(member, attr) == expected
 
 
 class TestDocument:
@@ -28,28 +40,49 @@ class TestDocument:
 
     def test_document_name_extracted_from_path(self):
         doc = Document(
-            id="doc-1", file_path="/some/long/path/document.pdf", file_type=FileType.PDF
+            id="doc-1",
+            file_path="/some/long/path/document.pdf",
+            file_type=FileType.PDF,
         )
 
         assert doc.name == "document.pdf"
 
-    def test_is_pdf(self):
-        pdf = Document(id="1", file_path="/test.pdf", file_type=FileType.PDF)
-        png = Document(id="2", file_path="/test.png", file_type=FileType.PNG)
-
-        assert pdf.is_pdf()
-        assert not png.is_pdf()
-
-    def test_is_image(self):
-        pdf = Document(id="1", file_path="/test.pdf", file_type=FileType.PDF)
-        png = Document(id="2", file_path="/test.png", file_type=FileType.PNG)
-
-        assert png.is_image()
-        assert not pdf.is_image()
+    @pytest.mark.parametrize("size", [0, LARGE_FILE_BYTES], ids=["zero", "large"])
+    def test_document_file_size(self, size: int):
+        doc = Document(
+            id="doc-1",
+            file_path="/uploads/invoice.pdf",
+            file_type=FileType.PDF,
+            file_size_bytes=size,
+        )
 
-    def test_documents_have_unique_timestamps(self):
+        assert doc.file_size_bytes == size
+
+    @pytest.mark.parametrize(
+        "file_type,path,expected_msg",
+        [
+            (FileType.PDF, "file.png", re.compile(r"expected \.pdf but got \.png")),
+            (FileType.PDF, "file.jpg", re.compile(r"expected \.pdf but got \.jpg")),
+            (FileType.PNG, "file.pdf", re.compile(r"expected \.png but got \.pdf")),
+        ],
+    )
+    def test_document_rejects_mismatched_extension(
+        self, file_type: FileType, path: str, expected_msg: re.Pattern[str]
+    ):
+        with pytest.raises(ValueError, match=expected_msg):
+            Document(id="x", file_path=path, file_type=file_type)
+
+    def test_is_pdf(self, sample_docs: dict[FileType, Document]):
+        assert sample_docs[FileType.PDF].is_pdf()
+        assert not sample_docs[FileType.PNG].is_pdf()
+
+    def test_is_image(self, sample_docs: dict[FileType, Document]):
+        assert sample_docs[FileType.PNG].is_image()
+        assert not sample_docs[FileType.PDF].is_image()
+
+    def test_documents_have_unique_timestamps(self, fake_clock: FakeClock):
         doc1 = Document(id="1", file_path="/a.pdf", file_type=FileType.PDF)
-        time.sleep(0.01)
         doc2 = Document(id="2", file_path="/b.pdf", file_type=FileType.PDF)
 
         assert doc1.uploaded_at < doc2.uploaded_at
+        assert doc2.uploaded_at == fake_clock.at(1)
@@ -1,9 +1,10 @@
-import time
-
 import pytest
 
 from kul_ocr.domain import exceptions
 from kul_ocr.domain.model import Job, JobStatus
+from tests.fakes.clock import FakeClock
+
+pytestmark = pytest.mark.xdist_group(name="domain_pure")
 
 
 class TestOCRJob:
@@ -23,15 +24,15 @@ class TestOCRJob:
         assert job.started_at is not None
         assert job.completed_at is None
 
-    def test_mark_job_as_completed(self):
+    def test_mark_job_as_completed(self, fake_clock: FakeClock):
         job = Job(document_id="test-doc", id="test-job-completion")
         job.mark_as_processing()
-        time.sleep(0.001)
         job.complete()
 
         assert job.status == JobStatus.COMPLETED
-        assert job.completed_at is not None
-        assert job.created_at < job.completed_at
+        assert job.created_at == fake_clock.at(0)
+        assert job.started_at == fake_clock.at(1)
+        assert job.completed_at == fake_clock.at(2)
         assert job.error_message is None
 
     def test_mark_job_as_failed(self):
@@ -80,25 +81,21 @@ class TestOCRJob:
         assert processing_job.status == JobStatus.FAILED
         assert processing_job.is_terminal
 
-    def test_job_completion_time(self):
+    def test_job_completion_time(self, fake_clock: FakeClock):
         job1 = Job(document_id="test-doc", id="test-timing-job-1")
-        time.sleep(0.001)
         job2 = Job(document_id="test-doc", id="test-timing-job-2")
 
         job1.mark_as_processing()
-        time.sleep(0.0001)
         job2.mark_as_processing()
 
         job2.complete()
-        time.sleep(0.0001)
         job1.complete()
 
-        assert job1.completed_at is not None
-        assert job2.completed_at is not None
-        assert job1.started_at is not None
-        assert job2.started_at is not None
-
-        assert job1.created_at < job2.created_at, "job1 got created first"
-        assert job1.completed_at > job2.completed_at, "job2 got completed first"
-        assert job1.started_at < job2.started_at, "job2 started before job1"
-        assert job1.duration > job2.duration, "job1 run longer than job2"
+        assert job1.created_at == fake_clock.at(0), "job1 got created first"
+        assert job2.created_at == fake_clock.at(1)
+        assert job1.started_at == fake_clock.at(2), "job1 started before job2"
+        assert job2.started_at == fake_clock.at(3)
+        assert job2.completed_at == fake_clock.at(4), "job2 got completed first"
+        assert job1.completed_at == fake_clock.at(5)
+        assert job1.duration == 3 * fake_clock.step, "job1 run longer than job2"
+        assert job2.duration == fake_clock.step
@@ -1,6 +1,6 @@
 # tests/unit/domain/model/test_result.py
 
-import time
+from collections.abc import Callable
 from datetime import datetime
 
 from kul_ocr.domain.model import (
@@ -12,6 +12,9 @@ from kul_ocr.domain.model import (
     PageRef,
     ProcessedPage,
 )
+from tests.fakes.clock import FakeClock
+
+FULL_TEXT = "Line 0Line 1Line 2"
 
 
 class TestBoundingBox:
@@ -37,25 +40,22 @@ class TestBoundingBox:
 class TestTextPart:
     """Tests for TextPart value object."""
 
-    def test_text_part_creation(self):
-        bbox = BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
+    def test_text_part_creation(self, default_bbox: BoundingBox):
         text_part = TextPart(
-            text="Hello, World!", bbox=bbox, confidence=0.95, level="block"
+            text="Hello, World!", bbox=default_bbox, confidence=0.95, level="block"
         )
 
         assert text_part.text == "Hello, World!"
         assert text_part.confidence == 0.95
         assert text_part.level == "block"
 
-    def test_text_part_optional_confidence(self):
-        bbox = BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
-        text_part = TextPart(text="Text", bbox=bbox, confidence=None)
+    def test_text_part_optional_confidence(self, default_bbox: BoundingBox):
+        text_part = TextPart(text="Text", bbox=default_bbox, confidence=None)
 
         assert text_part.confidence is None
 
-    def test_text_part_default_level(self):
-        bbox = BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
-        text_part = TextPart(text="Text", bbox=bbox)
+    def test_text_part_default_level(self, default_bbox: BoundingBox):
+        text_part = TextPart(text="Text", bbox=default_bbox)
 
         assert text_part.level == "block"
 
@@ -80,47 +80,26 @@ class TestPageMetadata:
 class TestPagePart:
     """Tests for PagePart value object."""
 
-    def test_page_part_creation(self):
-        bbox = BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
-        text_part = TextPart(text="Hello", bbox=bbox)
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=[text_part], metadata=metadata)
-
-        assert len(page_part.parts) == 1
-        assert page_part.parts[0].text == "Hello"
-        assert page_part.metadata.page_number == 1
-
-    def test_page_part_multiple_text_parts(self):
-        parts = [
-            TextPart(
-                text=f"Line {i}",
-                bbox=BoundingBox(
-                    x_min=float(i * 10),
-                    y_min=0.0,
-                    x_max=float((i + 1) * 10),
-                    y_max=20.0,
-                ),
-            )
-            for i in range(3)
-        ]
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=parts, metadata=metadata)
+    def test_page_part_creation(self, default_page_part: PagePart):
+        assert len(default_page_part.parts) == 1
+        assert default_page_part.parts[0].text == "Hello"
+        assert default_page_part.metadata.page_number == 1
+
+    def test_page_part_multiple_text_parts(
+        self, three_text_parts: list[TextPart], default_metadata: PageMetadata
+    ):
+        page_part = PagePart(parts=three_text_parts, metadata=default_metadata)
 
         assert len(page_part.parts) == 3
         assert page_part.parts[0].text == "Line 0"
         assert page_part.parts[2].text == "Line 2"
 
-    def test_page_part_full_text_property(self):
-        parts = [
-            TextPart(text="Line 1", bbox=BoundingBox(0.0, 0.0, 100.0, 20.0)),
-            TextPart(text="Line 2", bbox=BoundingBox(0.0, 20.0, 100.0, 40.0)),
-            TextPart(text="Line 3", bbox=BoundingBox(0.0, 40.0, 100.0, 60.0)),
-        ]
-        metadata = PageMetadata(page_number=1, width=100, height=60)
-        page_part = PagePart(parts=parts, metadata=metadata)
+    def test_page_part_full_text_property(
+        self, three_text_parts: list[TextPart], default_metadata: PageMetadata
+    ):
+        page_part = PagePart(parts=three_text_parts, metadata=default_metadata)
 
-        full_text = page_part.full_text
-        assert full_text == "Line 1Line 2Line 3"
+        assert page_part.full_text == FULL_TEXT
 
 
 class TestPageRef:
@@ -136,51 +115,35 @@ class TestPageRef:
 class TestProcessedPage:
     """Tests for ProcessedPage value object."""
 
-    def test_processed_page_creation(self):
-        bbox = BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
-        text_part = TextPart(text="Hello", bbox=bbox)
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=[text_part], metadata=metadata)
-        ref = PageRef(document_id="doc-123", index=0)
-
-        processed_page = ProcessedPage(ref=ref, result=page_part)
-
-        assert processed_page.ref.document_id == "doc-123"
-        assert processed_page.ref.index == 0
-        assert processed_page.result.metadata.page_number == 1
-        assert processed_page.result.parts[0].text == "Hello"
+    def test_processed_page_creation(self, default_processed_page: ProcessedPage):
+        assert default_processed_page.ref.document_id == "doc-123"
+        assert default_processed_page.ref.index == 0
+        assert default_processed_page.result.metadata.page_number == 1
+        assert default_processed_page.result.parts[0].text == "Hello"
 
 
 class TestOCRResult:
     """Tests for Result entity"""
 
-    def test_ocr_result_creation(self):
-        bbox = BoundingBox(x_min=0.0, y_min=0.0, x_max=100.0, y_max=50.0)
-        text_part = TextPart(text="Hello", bbox=bbox)
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=[text_part], metadata=metadata)
-        ref = PageRef(document_id="doc-123", index=0)
-        processed_page = ProcessedPage(ref=ref, result=page_part)
-
-        result = Result(id="result-1", job_id="job-1", content=[processed_page])
+    def test_ocr_result_creation(self, default_processed_page: ProcessedPage):
+        result = Result(id="result-1", job_id="job-1", content=[default_processed_page])
 
         assert result.id == "result-1"
         assert result.job_id == "job-1"
         assert len(result.content) == 1
         assert isinstance(result.creation_time, datetime)
 
-    def test_ocr_result_with_multiple_pages(self):
+    def test_ocr_result_with_multiple_pages(
+        self, make_text_part: Callable[..., TextPart]
+    ):
         pages = []
         for i in range(3):
-            text_part = TextPart(
-                text=f"Page {i + 1}",
-                bbox=BoundingBox(0.0, 0.0, 100.0, 50.0),
-            )
             metadata = PageMetadata(page_number=i, width=1000, height=1200)
-            page_part = PagePart(parts=[text_part], metadata=metadata)
+            page_part = PagePart(
+                parts=[make_text_part(f"Page {i + 1}")], metadata=metadata
+            )
             ref = PageRef(document_id="doc-123", index=i)
-            processed_page = ProcessedPage(ref=ref, result=page_part)
-            pages.append(processed_page)
+            pages.append(ProcessedPage(ref=ref, result=page_part))
 
         result = Result(id="result-1", job_id="job-1", content=pages)
 
@@ -188,50 +151,58 @@ class TestOCRResult:
         assert result.content[0].result.parts[0].text == "Page 1"
         assert result.content[2].result.parts[0].text == "Page 3"
 
-    def test_ocr_results_have_unique_timestamps(self):
-        text_part = TextPart(text="Text 1", bbox=BoundingBox(0.0, 0.0, 100.0, 50.0))
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=[text_part], metadata=metadata)
-        ref = PageRef(document_id="doc-123", index=0)
-        processed_page = ProcessedPage(ref=ref, result=page_part)
-
-        result1 = Result(id="1", job_id="job-1", content=[processed_page])
+    def test_ocr_result_from_pages(self, default_page_part: PagePart):
+        result = Result.from_pages(
+            id="result-1", document_id="doc-123", pages=[default_page_part]
+        )
 
-        time.sleep(0.01)
+        assert result.job_id == ""
+        assert result.content == [
+            ProcessedPage(
+                ref=PageRef(
+                    document_id="doc-123",
+                    index=default_page_part.metadata.page_number,
+                ),
+                result=default_page_part,
+            )
+        ]
 
-        text_part2 = TextPart(text="Text 2", bbox=BoundingBox(0.0, 0.0, 100.0, 50.0))
-        page_part2 = PagePart(parts=[text_part2], metadata=metadata)
-        processed_page2 = ProcessedPage(ref=ref, result=page_part2)
+    def test_ocr_results_have_unique_timestamps(
+        self,
+        fake_clock: FakeClock,
+        make_text_part: Callable[..., TextPart],
+        default_metadata: PageMetadata,
+        default_ref: PageRef,
+        default_processed_page: ProcessedPage,
+    ):
+        result1 = Result(id="1", job_id="job-1", content=[default_processed_page])
+
+        page_part2 = PagePart(
+            parts=[make_text_part("Text 2")], metadata=default_metadata
+        )
+        processed_page2 = ProcessedPage(ref=default_ref, result=page_part2)
 
         result2 = Result(id="2", job_id="job-2", content=[processed_page2])
 
         assert result1.creation_time < result2.creation_time
+        assert result2.creation_time == fake_clock.at(1)
 
-    def test_ocr_result_creation_time_auto_generated(self):
-        text_part = TextPart(text="Test", bbox=BoundingBox(0.0, 0.0, 100.0, 50.0))
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=[text_part], metadata=metadata)
-        ref = PageRef(document_id="doc-123", index=0)
-        processed_page = ProcessedPage(ref=ref, result=page_part)
-
-        before = datetime.now()
-        result = Result(id="1", job_id="job-1", content=[processed_page])
-        after = datetime.now()
+    def test_ocr_result_creation_time_auto_generated(
+        self, fake_clock: FakeClock, default_processed_page: ProcessedPage
+    ):
+        result = Result(id="1", job_id="job-1", content=[default_processed_page])
 
-        assert before <= result.creation_time <= after
+        assert result.creation_time == fake_clock.at(0)
 
-    def test_ocr_result_with_custom_creation_time(self):
+    def test_ocr_result_with_custom_creation_time(
+        self, default_processed_page: ProcessedPage
+    ):
         custom_time = datetime(2024, 1, 1, 12, 0, 0)
-        text_part = TextPart(text="Test", bbox=BoundingBox(0.0, 0.0, 100.0, 50.0))
-        metadata = PageMetadata(page_number=1, width=1000, height=1200)
-        page_part = PagePart(parts=[text_part], metadata=metadata)
-        ref = PageRef(document_id="doc-123", index=0)
-        processed_page = ProcessedPage(ref=ref, result=page_part)
 
         result = Result(
             id="1",
             job_id="job-1",
-            content=[processed_page],
+            content=[default_processed_page],
             creation_time=custom_time,
         )
 
@@ -5,14 +5,21 @@ from kul_ocr.domain.structs import PageInput
 # [TODO] original_document_id references attribute on Document model that is an UUID field. Currently we assume that it can be any string.
 
 
+@pytest.fixture(scope="module")
+def small_rgb_image() -> Image.Image:
+    """10x10 RGB image shared by tests that only store it on a PageInput."""
+    return Image.new("RGB", (10, 10))
+
+
 class TestPageInput:
     """Comprehensive tests for the PageInput dataclass."""
 
-    def test_can_create_page_input(self):
+    def test_can_create_page_input(self, small_rgb_image: Image.Image):
         """Shpuld create PageInput class."""
-        image = Image.new("RGB", (100, 100))
-        page_input = PageInput(image, page_number=1, original_document_id="doc-123")
-        assert page_input.image == image
+        page_input = PageInput(
+            small_rgb_image, page_number=1, original_document_id="doc-123"
+        )
+        assert page_input.image is small_rgb_image
         assert page_input.page_number == 1
         assert page_input.original_document_id == "doc-123"
 
@@ -26,86 +33,70 @@ class TestPageInput:
         assert page_input.page_number == 5
         assert page_input.original_document_id == "doc-xyz"
 
-    def test_page_input_with_page_number_zero(self):
-        """Should be able to access page number 0."""
-        image = Image.new("RGB", (10, 10))
-        page_input = PageInput(image=image, page_number=0, original_document_id="doc-0")
-        assert page_input.page_number == 0
-
-    def test_page_input_with_negative_page_number(self):
-        """Should be able to access page with negative number."""
-        image = Image.new("RGB", (10, 10))
+    @pytest.mark.parametrize("page_number", [0, -1, 9999, 1])
+    def test_page_input_page_number(
+        self, small_rgb_image: Image.Image, page_number: int
+    ):
+        """Should accept zero, negative and large page numbers."""
         page_input = PageInput(
-            image=image, page_number=-1, original_document_id="doc-neg"
+            image=small_rgb_image,
+            page_number=page_number,
+            original_document_id=f"doc-{page_number}",
         )
-        assert page_input.page_number == -1
+        assert page_input.page_number == page_number
 
-    def test_page_input_with_large_number(self):
-        """Should be able to access large number."""
-        image = Image.new("RGB", (10, 10))
+    @pytest.mark.parametrize("mode", ["RGB", "L", "RGBA"])
+    def test_page_input_with_different_image_modes(self, mode: str):
+        """Should work with diffrent PIL Image modes."""
+        image = Image.new(mode, (10, 10))
         page_input = PageInput(
-            image=image, page_number=9999, original_document_id="doc-large"
+            image=image, page_number=1, original_document_id=f"doc-{mode}"
         )
-        assert page_input.page_number == 9999
-
-    def test_page_input_with_different_image_modes(self):
-        """Should work with diffrent PIL Image modes."""
-        for mode in ["RGB", "L", "RGBA"]:
-            image = Image.new(mode, (10, 10))
-            page_input = PageInput(
-                image=image, page_number=1, original_document_id="doc-{mode}"
-            )
-            assert page_input.image.mode == mode
+        assert page_input.image.mode == mode
 
-    def test_page_input_with_different_image_sizes(self):
+    @pytest.mark.parametrize("size", [(10, 10), (100, 500)])
+    def test_page_input_with_different_image_sizes(self, size: tuple[int, int]):
         """Should work with diffrent size of image."""
-        for size in [(10, 10), (5000, 5000), (100, 500)]:
-            image = Image.new("RGB", size)
-            page_input = PageInput(
-                image=image,
-                page_number=1,
-                original_document_id=f"doc-{size[0]}x{size[1]}",
-            )
-            assert page_input.image.size == size
-
-    def test_page_input_with_empty_document_id(self):
-        """Should be able to access empty string as document_id."""
-        image = Image.new("RGB", (10, 10))
-        page_input = PageInput(image=image, page_number=1, original_document_id="")
-        assert page_input.original_document_id == ""
-
-    def test_page_input_with_long_document_id(self):
-        """Should be able to access long string as document_id."""
-        long_id = "a" * 1000
-        image = Image.new("RGB", (10, 10))
-        page_input = PageInput(image=image, page_number=1, original_document_id=long_id)
-        assert page_input.original_document_id == long_id
-
-    def test_page_input_with_special_characters_in_document_id(self):
-        """Should be able to access string with special characters as document_id."""
-        special_id = "doc-!@#$%^&*()_+абвгд"
-        image = Image.new("RGB", (10, 10))
+        image = Image.new("RGB", size)
+        page_input = PageInput(
+            image=image,
+            page_number=1,
+            original_document_id=f"doc-{size[0]}x{size[1]}",
+        )
+        assert page_input.image.size == size
+
+    @pytest.mark.parametrize(
+        "document_id",
+        ["", "a" * 1000, "doc-!@#$%^&*()_+абвгд"],
+        ids=["empty", "long", "special-characters"],
+    )
+    def test_page_input_document_id(
+        self, small_rgb_image: Image.Image, document_id: str
+    ):
+        """Should accept empty, long and special-character document ids."""
         page_input = PageInput(
-            image=image, page_number=1, original_document_id=special_id
+            image=small_rgb_image, page_number=1, original_document_id=document_id
         )
-        assert page_input.original_document_id == special_id
+        assert page_input.original_document_id == document_id
 
-    def test_slots_prevents_dynamic_attributes(self):
+    def test_slots_prevents_dynamic_attributes(self, small_rgb_image: Image.Image):
         """slots=True shoulld prevent adding new attributes"""
-        image = Image.new("RGB", (10, 10))
-        page_input = PageInput(image=image, page_number=1, original_document_id="doc-1")
+        page_input = PageInput(
+            image=small_rgb_image, page_number=1, original_document_id="doc-1"
+        )
         with pytest.raises(AttributeError):
             page_input.new_field = "not allowed"  # pyright: ignore[reportAttributeAccessIssue]
 
-    def test_can_modify_existing_attributes(self):
+    def test_can_modify_existing_attributes(self, small_rgb_image: Image.Image):
         """Dataclass is mutable by default; existing fields can be modified."""
-        image = Image.new("RGB", (10, 10))
-        page_input = PageInput(image=image, page_number=1, original_document_id="doc-1")
+        page_input = PageInput(
+            image=small_rgb_image, page_number=1, original_document_id="doc-1"
+        )
         new_image = Image.new("L", (5, 5))
         page_input.image = new_image
         page_input.page_number = 42
         page_input.original_document_id = "doc-updated"
 
-        assert page_input.image == new_image
+        assert page_input.image is new_image
         assert page_input.page_number == 42
         assert page_input.original_document_id == "doc-updated"
@@ -9,18 +9,28 @@ from kul_ocr.entrypoints.api import app
 from kul_ocr.utils.misc import nobeartype
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anyio_backend() -> str:
     """Specifies the backend to use for asynchronous tests."""
     return "asyncio"
 
 
-@pytest_asyncio.fixture(autouse=True)
+@pytest.fixture(scope="session")
+def asgi_transport() -> ASGITransport:
+    """Transport wrapping the app; the app defines no lifespan hooks."""
+    return ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 @nobeartype
 async def client(
     anyio_backend: Literal["asyncio"],
+    asgi_transport: ASGITransport,
 ) -> AsyncGenerator[AsyncClient, None]:
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as client:
+    """One client for the whole session; the app boots once.
+
+    Tests swap dependencies through app.dependency_overrides and clear them
+    in their own fixtures, so the transport itself never needs rebuilding.
+    """
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as client:
         yield client
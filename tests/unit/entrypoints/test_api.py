@@ -1,53 +1,108 @@
 from collections.abc import Iterator
-from io import BytesIO
 from pathlib import Path
 from typing import Any, cast
-from unittest.mock import patch
-from uuid import uuid4
+from unittest.mock import MagicMock, patch
+from uuid import UUID
 
 import pytest
+import httpx
 from httpx import AsyncClient
 
 from kul_ocr.domain import model
 from kul_ocr.domain.model import Document, FileType, JobStatus, Job
 from kul_ocr.entrypoints import dependencies, schemas
 from kul_ocr.entrypoints.api import app
-from tests import factories
 from tests.factories import generate_document, generate_ocr_job, generate_ocr_result
+from tests.fakes.pool import next_id, pooled_document, pooled_job
 from tests.fakes.repositories import FakeDocumentRepository
 from tests.fakes.storages import FakeFileStorage
 from tests.fakes.uow import FakeUnitOfWork
 
+pytestmark = [
+    pytest.mark.asyncio,
+    # Keep the module on one xdist worker so its module-scoped fakes are built once.
+    pytest.mark.xdist_group(name="entrypoints_api"),
+]
 
-@pytest.fixture
+
+def _encode_multipart(
+    content: bytes, filename: str, content_type: str
+) -> tuple[bytes, dict[str, str]]:
+    """Multipart body and headers for a single ``file`` field, encoded by httpx."""
+    request = httpx.Request(
+        "POST", "http://test", files={"file": (filename, content, content_type)}
+    )
+    return request.read(), {"Content-Type": request.headers["Content-Type"]}
+
+
+_UPLOAD_CONTENT = b"fake pdf content"
+_UPLOAD_BODY, _UPLOAD_HEADERS = _encode_multipart(
+    _UPLOAD_CONTENT, "test.pdf", "application/pdf"
+)
+
+
+@pytest.fixture(scope="module")
 def fake_storage() -> FakeFileStorage:
     return FakeFileStorage()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fake_uow() -> FakeUnitOfWork:
     return FakeUnitOfWork()
 
 
 @pytest.fixture
+def fake_documents(fake_uow: FakeUnitOfWork) -> FakeDocumentRepository:
+    """The fake uow's document repository, typed as the fake."""
+    return cast(FakeDocumentRepository, fake_uow.documents)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_delay() -> Iterator[MagicMock]:
+    """Keep Celery off the broker for the whole module."""
+    with patch("kul_ocr.entrypoints.tasks.process_ocr_job_task.delay") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_fakes(
+    fake_storage: FakeFileStorage, fake_uow: FakeUnitOfWork, mock_delay: MagicMock
+) -> None:
+    """Give each test empty fakes and a clean Celery mock without rebuilding them."""
+    fake_storage.reset()
+    fake_uow.reset()
+    mock_delay.reset_mock()
+
+
+@pytest.fixture(scope="module", autouse=True)
 def override_dependencies(
     fake_storage: FakeFileStorage,
     fake_uow: FakeUnitOfWork,
 ) -> Iterator[None]:
-    app.dependency_overrides[dependencies.get_file_storage] = lambda: fake_storage
-    app.dependency_overrides[dependencies.get_uow] = lambda: fake_uow
+    app.dependency_overrides.update(
+        {
+            dependencies.get_file_storage: lambda: fake_storage,
+            dependencies.get_uow: lambda: fake_uow,
+        }
+    )
     yield
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="module")
+def _stored_document_data() -> tuple[str, str, bytes]:
+    document_id_str = next_id()
+    return document_id_str, f"{document_id_str}.pdf", b"%PDF-1.4 fake streamed content"
+
+
 @pytest.fixture
 def stored_document(
-    fake_storage: FakeFileStorage, fake_uow: FakeUnitOfWork
+    _stored_document_data: tuple[str, str, bytes],
+    fake_storage: FakeFileStorage,
+    fake_uow: FakeUnitOfWork,
 ) -> tuple[str, str, bytes]:
-    document_id = uuid4()
-    document_id_str = str(document_id)
-    filename = f"{document_id_str}.pdf"
-    file_bytes = b"%PDF-1.4 fake streamed content"
+    """Put the module's stored document back into the freshly reset fakes."""
+    document_id_str, filename, file_bytes = _stored_document_data
 
     fake_storage.files[filename] = file_bytes
 
@@ -63,36 +118,31 @@ def stored_document(
     return document_id_str, filename, file_bytes
 
 
-@pytest.mark.asyncio
 async def test_upload_document_success(
     client: AsyncClient,
     fake_storage: FakeFileStorage,
     fake_uow: FakeUnitOfWork,
-    override_dependencies: None,
+    fake_documents: FakeDocumentRepository,
 ) -> None:
     """Test successful document upload via POST /documents endpoint."""
-    file_content: bytes = b"fake pdf content"
-    files = {"file": ("test.pdf", BytesIO(file_content), "application/pdf")}
-
-    response = await client.post("/documents", files=files)
-
-    document = schemas.DocumentResponse(**response.json())
+    response = await client.post(
+        "/documents", content=_UPLOAD_BODY, headers=_UPLOAD_HEADERS
+    )
 
     assert response.status_code == 200
+    data: dict[str, Any] = response.json()
 
-    assert document.file_type == model.FileType.PDF.value
+    assert data["file_type"] == model.FileType.PDF.value
 
-    assert document.file_size_bytes == len(file_content)
+    assert data["file_size_bytes"] == len(_UPLOAD_CONTENT)
 
     assert fake_storage.save_call_count == 1
-    fake_uow_docs = cast(FakeDocumentRepository, fake_uow.documents)
-    assert len(fake_uow_docs.added) == 1
+    assert len(fake_documents.added) == 1
     assert fake_uow.committed is True
 
 
-@pytest.mark.asyncio
 async def test_get_document_success(
-    client: AsyncClient, fake_uow: FakeUnitOfWork, override_dependencies: None
+    client: AsyncClient, fake_uow: FakeUnitOfWork
 ) -> None:
     """Document exists and returned correctly."""
     doc = generate_document(dir_path=Path("fake_dir"), file_size_in_bytes=1234)
@@ -102,15 +152,28 @@ async def test_get_document_success(
     response = await client.get(f"/documents/{doc.id}")
 
     assert response.status_code == 200
-    parsed_response = schemas.DocumentResponse(**response.json())
-    assert str(parsed_response.id) == doc.id
-    assert parsed_response.file_path == doc.file_path
+    parsed = schemas.DocumentResponse.model_validate_json(response.content)
+    assert parsed.id == UUID(doc.id)
+    assert parsed.file_path == doc.file_path
+    assert parsed.file_type == doc.file_type.value
+    assert parsed.file_size_bytes == 1234
 
 
-@pytest.mark.asyncio
-async def test_get_document_not_found(
-    client: AsyncClient, override_dependencies: None
+async def test_download_document_success(
+    client: AsyncClient, stored_document: tuple[str, str, bytes]
 ) -> None:
+    """Stored document is streamed back with its content type and filename."""
+    document_id, filename, file_bytes = stored_document
+
+    response = await client.get(f"/documents/{document_id}/download")
+
+    assert response.status_code == 200
+    assert response.content == file_bytes
+    assert response.headers["content-type"] == model.FileType.PDF.value
+    assert filename in response.headers["content-disposition"]
+
+
+async def test_get_document_not_found(client: AsyncClient) -> None:
     """Should return 404 when document does not exist."""
 
     response = await client.get("/documents/00000000-0000-0000-0000-000000000000")
@@ -119,196 +182,100 @@ async def test_get_document_not_found(
     assert "message" in response.json()
 
 
-@pytest.mark.asyncio
-async def test_get_latest_result_success(
-    client: AsyncClient, fake_uow: FakeUnitOfWork, override_dependencies: None
-) -> None:
-    """Document exists and has OCR result attached."""
+@pytest.fixture
+def stored_doc(fake_uow: FakeUnitOfWork) -> Document:
+    """Document already present in the unit of work, with no jobs yet."""
     doc = generate_document(dir_path=Path("fake_dir"), file_size_in_bytes=1234)
+    fake_uow.documents.add(doc)
+    return doc
+
+
+async def test_get_latest_result(
+    client: AsyncClient, fake_uow: FakeUnitOfWork, stored_doc: Document
+) -> None:
+    """Latest result is returned when a completed job exists."""
     ocr_job = generate_ocr_job()
     ocr_job.status = model.JobStatus.COMPLETED
-    ocr_job.document_id = doc.id
+    ocr_job.document_id = stored_doc.id
     ocr_result = generate_ocr_result()
     ocr_result.job_id = ocr_job.id
-
-    fake_uow.documents.add(doc)
     fake_uow.jobs.add(ocr_job)
     fake_uow.results.add(ocr_result)
     fake_uow.commit()
 
-    response = await client.get(f"/documents/{doc.id}/latest-result")
+    response = await client.get(f"/documents/{stored_doc.id}/latest-result")
 
     assert response.status_code == 200
-    parsed_response = schemas.ResultResponse(**response.json())
-    assert str(parsed_response.id) == ocr_result.id
+    parsed = schemas.ResultResponse.model_validate_json(response.content)
+    assert parsed.id == UUID(ocr_result.id)
 
 
-@pytest.mark.asyncio
-async def test_get_latest_result_no_result(
-    client: AsyncClient, fake_uow: FakeUnitOfWork, override_dependencies: None
+async def test_get_latest_result_not_found(
+    client: AsyncClient, fake_uow: FakeUnitOfWork, stored_doc: Document
 ) -> None:
-    """Document exists but has no completed OCR result."""
-    doc = generate_document(dir_path=Path("fake_dir"), file_size_in_bytes=1234)
-    fake_uow.documents.add(doc)
+    """Should return 404 when the document has no completed job."""
     fake_uow.commit()
 
-    response = await client.get(f"/documents/{doc.id}/latest-result")
+    response = await client.get(f"/documents/{stored_doc.id}/latest-result")
 
     assert response.status_code == 404
-    assert "No OCR result found" in response.json()["detail"]
-
-
-@pytest.fixture(autouse=True)
-def setup_override(fake_uow: FakeUnitOfWork) -> Iterator[None]:
-    app.dependency_overrides[dependencies.get_uow] = lambda: fake_uow
-    yield
-    app.dependency_overrides.clear()
-
-
-@pytest.mark.asyncio
-async def test_list_ocr_jobs_returns_all_jobs(
-    client: AsyncClient, fake_uow: FakeUnitOfWork
-) -> None:
-    doc = factories.generate_document(dir_path=Path("/tmp"))
-    fake_uow.documents.add(doc)
-
-    job1 = factories.generate_ocr_job(status=model.JobStatus.PENDING)
-    job1.document_id = doc.id
-
-    job2 = factories.generate_ocr_job(status=model.JobStatus.COMPLETED)
-    job2.document_id = doc.id
-
-    fake_uow.jobs.add(job1)
-    fake_uow.jobs.add(job2)
-    fake_uow.commit()
-
-    response = await client.get("/ocr/jobs")
-
-    assert response.status_code == 200
-    data: dict[str, Any] = response.json()
-
-    assert data["total"] == 2
-    assert len(data["jobs"]) == 2
-
-    ids: list[str] = [job["id"] for job in data["jobs"]]
-    assert job1.id in ids
-    assert job2.id in ids
-
-
-@pytest.mark.asyncio
-async def test_list_ocr_jobs_filters_by_status(
-    client: AsyncClient, fake_uow: FakeUnitOfWork
-) -> None:
-    doc = factories.generate_document(dir_path=Path("/tmp"))
-    fake_uow.documents.add(doc)
-
-    target_job = factories.generate_ocr_job(status=model.JobStatus.COMPLETED)
-    target_job.document_id = doc.id
-
-    other_job = factories.generate_ocr_job(status=model.JobStatus.PENDING)
-    other_job.document_id = doc.id
-
-    fake_uow.jobs.add(target_job)
-    fake_uow.jobs.add(other_job)
-    fake_uow.commit()
-
-    response = await client.get(f"/ocr/jobs?status={model.JobStatus.COMPLETED.value}")
-
-    assert response.status_code == 200
-    data: dict[str, Any] = response.json()
-
-    assert data["total"] == 1
-    assert data["jobs"][0]["id"] == target_job.id
-    assert data["jobs"][0]["status"] == model.JobStatus.COMPLETED.value
-
-
-@pytest.mark.asyncio
-async def test_list_ocr_jobs_filters_by_document_id(
-    client: AsyncClient, fake_uow: FakeUnitOfWork
-) -> None:
-    doc_target = factories.generate_document(dir_path=Path("/tmp"))
-    doc_other = factories.generate_document(dir_path=Path("/tmp"))
-    fake_uow.documents.add(doc_target)
-    fake_uow.documents.add(doc_other)
-
-    job1 = factories.generate_ocr_job(status=model.JobStatus.PENDING)
-    job1.document_id = doc_target.id
-
-    job2 = factories.generate_ocr_job(status=model.JobStatus.COMPLETED)
-    job2.document_id = doc_target.id
-
-    job_other = factories.generate_ocr_job(status=model.JobStatus.PENDING)
-    job_other.document_id = doc_other.id
-
-    fake_uow.jobs.add(job1)
-    fake_uow.jobs.add(job2)
-    fake_uow.jobs.add(job_other)
-    fake_uow.commit()
-
-    response = await client.get(f"/documents/{doc_target.id}")  # Verify doc exists
-    assert response.status_code == 200
-
-    response = await client.get(f"/ocr/jobs?document_id={doc_target.id}")
-
-    assert response.status_code == 200
-    data: dict[str, Any] = response.json()
-
-    assert data["total"] == 2
-    returned_ids: set[str] = {job["id"] for job in data["jobs"]}
-    assert returned_ids == {job1.id, job2.id}
-    assert job_other.id not in returned_ids
-
-
-@pytest.mark.asyncio
-async def test_list_ocr_jobs_filters_by_both(
-    client: AsyncClient, fake_uow: FakeUnitOfWork
+    assert b"No OCR result found" in response.content
+
+
+@pytest.fixture(scope="module")
+def _list_jobs_data() -> tuple[dict[str, Document], dict[str, Job]]:
+    """Two documents and three jobs covering every list-jobs filter combination."""
+    documents = {"a": pooled_document(), "b": pooled_document()}
+    jobs = {
+        "a_pending": pooled_job(JobStatus.PENDING, document_id=documents["a"].id),
+        "a_completed": pooled_job(JobStatus.COMPLETED, document_id=documents["a"].id),
+        "b_completed": pooled_job(JobStatus.COMPLETED, document_id=documents["b"].id),
+    }
+    return documents, jobs
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        pytest.param("", {"a_pending", "a_completed", "b_completed"}, id="all"),
+        pytest.param(
+            f"status={JobStatus.COMPLETED.value}",
+            {"a_completed", "b_completed"},
+            id="by-status",
+        ),
+        pytest.param(
+            "document_id={a}", {"a_pending", "a_completed"}, id="by-document-id"
+        ),
+        pytest.param(
+            f"document_id={{a}}&status={JobStatus.COMPLETED.value}",
+            {"a_completed"},
+            id="by-both",
+        ),
+        pytest.param(f"status={JobStatus.FAILED.value}", set(), id="no-matches"),
+    ],
+)
+async def test_list_ocr_jobs_filters(
+    client: AsyncClient,
+    fake_uow: FakeUnitOfWork,
+    _list_jobs_data: tuple[dict[str, Document], dict[str, Job]],
+    query: str,
+    expected: set[str],
 ) -> None:
-    doc_a = factories.generate_document(dir_path=Path("/tmp"))
-    doc_b = factories.generate_document(dir_path=Path("/tmp"))
-    fake_uow.documents.add(doc_a)
-    fake_uow.documents.add(doc_b)
+    documents, jobs = _list_jobs_data
+    fake_uow.documents.add_many(documents.values())
+    fake_uow.jobs.add_many(jobs.values())
 
-    target_job = factories.generate_ocr_job(status=model.JobStatus.COMPLETED)
-    target_job.document_id = doc_a.id
-
-    wrong_status = factories.generate_ocr_job(status=model.JobStatus.PENDING)
-    wrong_status.document_id = doc_a.id
-
-    wrong_doc = factories.generate_ocr_job(status=model.JobStatus.COMPLETED)
-    wrong_doc.document_id = doc_b.id
-
-    fake_uow.jobs.add(target_job)
-    fake_uow.jobs.add(wrong_status)
-    fake_uow.jobs.add(wrong_doc)
-    fake_uow.commit()
-
-    url = f"/ocr/jobs?document_id={doc_a.id}&status={model.JobStatus.COMPLETED.value}"
-    response = await client.get(url)
+    response = await client.get(
+        f"/ocr/jobs?{query.format(**{k: d.id for k, d in documents.items()})}"
+    )
 
     assert response.status_code == 200
     data: dict[str, Any] = response.json()
 
-    assert data["total"] == 1
-    assert data["jobs"][0]["id"] == target_job.id
+    assert data["total"] == len(expected)
+    assert {job["id"] for job in data["jobs"]} == {jobs[key].id for key in expected}
 
 
-@pytest.mark.asyncio
-async def test_list_ocr_jobs_returns_empty_when_no_matches(
-    client: AsyncClient, fake_uow: FakeUnitOfWork
-) -> None:
-    job = factories.generate_ocr_job(status=model.JobStatus.PENDING)
-    fake_uow.jobs.add(job)
-    fake_uow.commit()
-
-    response = await client.get(f"/ocr/jobs?status={model.JobStatus.FAILED.value}")
-
-    assert response.status_code == 200
-    data: dict[str, Any] = response.json()
-    assert data["total"] == 0
-    assert data["jobs"] == []
-
-
-@pytest.mark.asyncio
 async def test_list_ocr_jobs_returns_400_for_invalid_status(
     client: AsyncClient, fake_uow: FakeUnitOfWork
 ) -> None:
@@ -323,13 +290,11 @@ async def test_list_ocr_jobs_returns_400_for_invalid_status(
     assert invalid_status in error_msg
 
 
-@pytest.mark.asyncio
 async def test_create_ocr_job_returns_pending_job(
     client: AsyncClient,
     fake_uow: FakeUnitOfWork,
-    override_dependencies: None,
 ) -> None:
-    document_id: str = str(uuid4())
+    document_id: str = next_id()
     doc = Document(
         id=document_id,
         file_path="test.pdf",
@@ -353,18 +318,14 @@ async def test_create_ocr_job_returns_pending_job(
     assert saved_job.document_id == document_id
 
 
-@pytest.mark.asyncio
-@pytest.mark.skip(
-    reason="Celery tasks require RabbitMQ broker which is not available in test environment"
-)
 async def test_start_ocr_job_success(
     client: AsyncClient,
     fake_uow: FakeUnitOfWork,
-    override_dependencies: None,
+    mock_delay: MagicMock,
 ) -> None:
     """Test starting an OCR job triggers the Celery task."""
-    document_id = str(uuid4())
-    job_id = str(uuid4())
+    document_id = next_id()
+    job_id = next_id()
 
     doc = Document(
         id=document_id,
@@ -378,30 +339,27 @@ async def test_start_ocr_job_success(
     fake_uow.jobs.add(job)
     fake_uow.commit()
 
-    with patch("kul_ocr.entrypoints.tasks.process_ocr_job_task.delay") as mock_delay:
-        response = await client.post(f"/ocr/jobs/{job_id}/start")
+    response = await client.post(f"/ocr/jobs/{job_id}/start")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "processing"
-        assert data["id"] == job_id
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "processing"
+    assert data["id"] == job_id
 
-        # Verify job status in DB
-        saved_job = fake_uow.jobs.get(job_id)
-        assert saved_job is not None
-        assert saved_job.status == JobStatus.PROCESSING
+    # Verify job status in DB
+    saved_job = fake_uow.jobs.get(job_id)
+    assert saved_job is not None
+    assert saved_job.status == JobStatus.PROCESSING
 
-        # Verify Celery task was triggered
-        mock_delay.assert_called_once_with(job_id)
+    # Verify Celery task was triggered
+    mock_delay.assert_called_once_with(job_id)
 
 
-@pytest.mark.asyncio
 async def test_create_ocr_job_returns_404_for_nonexistent_document(
     client: AsyncClient,
     fake_uow: FakeUnitOfWork,
-    override_dependencies: None,
 ) -> None:
-    non_existent_id: str = str(uuid4())
+    non_existent_id: str = next_id()
 
     response = await client.post("/ocr/jobs", json={"document_id": non_existent_id})
 
@@ -411,16 +369,12 @@ async def test_create_ocr_job_returns_404_for_nonexistent_document(
     assert len(fake_uow.jobs.list_all()) == 0
 
 
-@pytest.mark.asyncio
-@pytest.mark.skip(
-    reason="Celery tasks require RabbitMQ broker which is not available in test environment"
-)
 async def test_create_ocr_job_returns_409_when_job_already_pending(
     client: AsyncClient,
     fake_uow: FakeUnitOfWork,
-    override_dependencies: None,
+    mock_delay: MagicMock,
 ) -> None:
-    document_id: str = str(uuid4())
+    document_id: str = next_id()
     doc = Document(
         id=document_id,
         file_path="test.pdf",
@@ -433,19 +387,16 @@ async def test_create_ocr_job_returns_409_when_job_already_pending(
     fake_uow.jobs.add(existing_job)
     fake_uow.commit()
 
-    with patch("kul_ocr.entrypoints.tasks.process_ocr_job_task.delay") as mock_delay:
-        response = await client.post("/ocr/jobs", json={"document_id": document_id})
+    response = await client.post("/ocr/jobs", json={"document_id": document_id})
 
     assert response.status_code == 409
-    assert "already has a pending" in response.json()["message"]
+    assert b"already has a pending" in response.content
 
     mock_delay.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_create_ocr_job_validates_request_body(
     client: AsyncClient,
-    override_dependencies: None,
 ) -> None:
     response = await client.post("/ocr/jobs", json={})
     assert response.status_code == 422
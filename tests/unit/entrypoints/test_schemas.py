@@ -1,6 +1,8 @@
+import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Any
 from uuid import UUID
 
 import pytest
@@ -10,6 +12,21 @@ from kul_ocr.domain import model
 from kul_ocr.entrypoints import schemas
 from tests import factories
 
+_UUID_RE = re.compile("UUID")
+_VALIDATION_ERROR_RE = re.compile("validation error")
+_NON_NEGATIVE_RE = re.compile("greater than or equal to 0")
+_TRAVERSAL_RE = re.compile("traversal characters")
+_EMPTY_RE = re.compile("empty")
+
+# A valid DocumentResponse payload; each validation test overrides one field.
+_BASE_KWARGS: dict[str, Any] = {
+    "id": UUID("550e8400-e29b-41d4-a716-446655440000"),
+    "file_path": "/tmp/valid_file.pdf",
+    "file_type": model.FileType.PDF,
+    "file_size_bytes": 1024,
+    "uploaded_at": datetime(year=2022, month=1, day=1, hour=12),
+}
+
 
 class TestDocumentResponse:
     """Tests for mapping domain objects to schemas (Happy Path)."""
@@ -34,11 +51,11 @@ class TestDocumentResponse:
         ],
     )
     def test_from_domain_with_different_file_types(
-        self, file_type: model.FileType, tmp_path: Path
+        self, file_type: model.FileType, fake_dir: Path
     ):
         document = factories.generate_document(
             file_type=file_type,
-            dir_path=tmp_path,
+            dir_path=fake_dir,
         )
 
         response = schemas.DocumentResponse.from_domain(document)
@@ -52,62 +69,24 @@ class TestEnum(Enum):
 class TestDocumentResponseValidation:
     """Tests for validation rules (Error Cases)."""
 
-    VALID_UUID = UUID("550e8400-e29b-41d4-a716-446655440000")
-    VALID_DATE = datetime(
-        year=2022, month=1, day=1, hour=12, minute=0, second=0, tzinfo=None
-    )
-    VALID_PATH = "/tmp/valid_file.pdf"
-    VALID_TYPE = model.FileType.PDF
-    VALID_SIZE = 1024
-
-    INVALID_ENUM = TestEnum.TEST
-
     def test_rejects_invalid_uuid(self):
-        with pytest.raises((ValidationError, ValueError), match="UUID"):
-            schemas.DocumentResponse(
-                id=UUID("not-a-uuid"),
-                file_path=self.VALID_PATH,
-                file_type=self.VALID_TYPE,
-                file_size_bytes=self.VALID_SIZE,
-                uploaded_at=self.VALID_DATE,
-            )
+        with pytest.raises((ValidationError, ValueError), match=_UUID_RE):
+            schemas.DocumentResponse(**{**_BASE_KWARGS, "id": UUID("not-a-uuid")})
 
     def test_rejects_unsupported_mime_type(self):
-        with pytest.raises(ValidationError, match="validation error"):
-            schemas.DocumentResponse(
-                id=self.VALID_UUID,
-                file_path=self.VALID_PATH,
-                file_type=self.INVALID_ENUM,
-                file_size_bytes=self.VALID_SIZE,
-                uploaded_at=self.VALID_DATE,
-            )
+        with pytest.raises(ValidationError, match=_VALIDATION_ERROR_RE):
+            schemas.DocumentResponse(**{**_BASE_KWARGS, "file_type": TestEnum.TEST})
 
     def test_rejects_negative_file_size(self):
-        with pytest.raises(ValidationError, match="greater than or equal to 0"):
-            schemas.DocumentResponse(
-                id=self.VALID_UUID,
-                file_path=self.VALID_PATH,
-                file_type=self.VALID_TYPE,
-                file_size_bytes=-50,
-                uploaded_at=self.VALID_DATE,
-            )
+        with pytest.raises(ValidationError, match=_NON_NEGATIVE_RE):
+            schemas.DocumentResponse(**{**_BASE_KWARGS, "file_size_bytes": -50})
 
     def test_rejects_path_traversal(self):
-        with pytest.raises(ValidationError, match="traversal characters"):
+        with pytest.raises(ValidationError, match=_TRAVERSAL_RE):
             schemas.DocumentResponse(
-                id=self.VALID_UUID,
-                file_path="../../etc/passwd",
-                file_type=self.VALID_TYPE,
-                file_size_bytes=self.VALID_SIZE,
-                uploaded_at=self.VALID_DATE,
+                **{**_BASE_KWARGS, "file_path": "../../etc/passwd"}
             )
 
     def test_rejects_empty_file_path(self):
-        with pytest.raises(ValidationError, match="empty"):
-            schemas.DocumentResponse(
-                id=self.VALID_UUID,
-                file_path="   ",
-                file_type=self.VALID_TYPE,
-                file_size_bytes=self.VALID_SIZE,
-                uploaded_at=self.VALID_DATE,
-            )
+        with pytest.raises(ValidationError, match=_EMPTY_RE):
+            schemas.DocumentResponse(**{**_BASE_KWARGS, "file_path": "   "})
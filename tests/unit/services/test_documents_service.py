@@ -1,3 +1,5 @@
+import re
+from io import BytesIO
 from pathlib import Path
 
 import pytest
@@ -9,17 +11,32 @@ from tests import factories
 from tests.fakes.uow import FakeUnitOfWork
 from tests.fakes.storages import FakeFileStorage
 
+_EXTENSION_MISMATCH_RE = re.compile(r"Document extension mismatch")
+_DOC_NOT_FOUND_RE = re.compile(r"Document .* not found")
+
+_FILE_CONTENT = b"fake file content"
+
 
 @pytest.fixture
 def fake_uow() -> FakeUnitOfWork:
     return FakeUnitOfWork()
 
 
+@pytest.fixture
+def fake_storage() -> FakeFileStorage:
+    return FakeFileStorage()
+
+
+@pytest.fixture
+def file_stream() -> BytesIO:
+    return BytesIO(_FILE_CONTENT)
+
+
 def test_get_document_returns_existing_document(
-    fake_uow: FakeUnitOfWork, tmp_path: Path
+    fake_uow: FakeUnitOfWork, fake_dir: Path
 ):
     """Test getting an existing document."""
-    document = factories.generate_document(dir_path=tmp_path)
+    document = factories.generate_document(dir_path=fake_dir)
     fake_uow.documents.add(document)
 
     retrieved = fake_uow.documents.get(document.id)
@@ -35,46 +52,48 @@ def test_get_document_not_found(fake_uow: FakeUnitOfWork):
     assert result is None
 
 
-def test_upload_document(fake_uow: FakeUnitOfWork, tmp_path: Path):
-    """Test uploading a document."""
-    from io import BytesIO
-
-    file_stream = BytesIO(b"fake file content")
-    fake_storage = FakeFileStorage()
-
+@pytest.mark.parametrize("file_type", list(FileType), ids=lambda ft: ft.name)
+def test_upload_document(
+    fake_uow: FakeUnitOfWork,
+    fake_storage: FakeFileStorage,
+    file_stream: BytesIO,
+    file_type: FileType,
+):
+    """Test uploading a document of each supported file type."""
     result = services.upload_document(
         file_stream=file_stream,
-        file_size=18,
-        file_type=FileType.PDF,
+        file_size=len(_FILE_CONTENT),
+        file_type=file_type,
         storage=fake_storage,
         uow=fake_uow,
     )
 
     assert result.id is not None
-    assert result.file_type == FileType.PDF.value
+    assert result.file_type == file_type.value
+    assert result.file_path.endswith(file_type.dot_extension)
 
 
-def test_upload_document_extension_mismatch(fake_uow: FakeUnitOfWork, tmp_path: Path):
+def test_upload_document_extension_mismatch(
+    fake_uow: FakeUnitOfWork, fake_storage: FakeFileStorage
+):
     """Test that document with mismatched extension raises ValueError."""
-    from io import BytesIO
-
-    file_stream = BytesIO(b"fake txt content")
+    # Rejected on the name alone; upload_document only seeks the stream first.
+    file_stream = BytesIO()
     file_stream.name = "test.txt"
-    fake_storage = FakeFileStorage()
 
-    with pytest.raises(ValueError, match="Document extension mismatch"):
+    with pytest.raises(ValueError, match=_EXTENSION_MISMATCH_RE):
         services.upload_document(
             file_stream=file_stream,
-            file_size=16,
+            file_size=0,
             file_type=FileType.PDF,
             storage=fake_storage,
             uow=fake_uow,
         )
 
 
-def test_get_document_for_processing(fake_uow: FakeUnitOfWork, tmp_path: Path):
+def test_get_document_for_processing(fake_uow: FakeUnitOfWork, fake_dir: Path):
     """Test getting document for OCR processing."""
-    document = factories.generate_document(dir_path=tmp_path)
+    document = factories.generate_document(dir_path=fake_dir)
     fake_uow.documents.add(document)
 
     result = services.get_document_for_processing(document.id, fake_uow)
@@ -85,13 +104,13 @@ def test_get_document_for_processing(fake_uow: FakeUnitOfWork, tmp_path: Path):
 
 def test_get_document_for_processing_not_found(fake_uow: FakeUnitOfWork):
     """Test getting non-existent document raises exception."""
-    with pytest.raises(exceptions.DocumentNotFoundError, match="Document .* not found"):
+    with pytest.raises(exceptions.DocumentNotFoundError, match=_DOC_NOT_FOUND_RE):
         services.get_document_for_processing("nonexistent-doc", fake_uow)
 
 
-def test_get_latest_result_for_document(fake_uow: FakeUnitOfWork, tmp_path: Path):
+def test_get_latest_result_for_document(fake_uow: FakeUnitOfWork, fake_dir: Path):
     """Test getting latest result for a document."""
-    document = factories.generate_document(tmp_path)
+    document = factories.generate_document(fake_dir)
     job = factories.generate_ocr_job()
     job.status = JobStatus.COMPLETED
     job.document_id = document.id
@@ -108,19 +127,17 @@ def test_get_latest_result_for_document(fake_uow: FakeUnitOfWork, tmp_path: Path
     assert str(result.id) == str(ocr_result.id)
 
 
-def test_get_latest_result_for_document_not_found(
-    fake_uow: FakeUnitOfWork, tmp_path: Path
-):
+def test_get_latest_result_for_document_not_found(fake_uow: FakeUnitOfWork):
     """Test that getting result for non-existent document raises exception."""
-    with pytest.raises(exceptions.DocumentNotFoundError, match="Document .* not found"):
+    with pytest.raises(exceptions.DocumentNotFoundError, match=_DOC_NOT_FOUND_RE):
         services.get_latest_result_for_document("nonexistent-doc", fake_uow)
 
 
 def test_get_latest_result_for_document_no_results(
-    fake_uow: FakeUnitOfWork, tmp_path: Path
+    fake_uow: FakeUnitOfWork, fake_dir: Path
 ):
     """Test that getting result for document with no completed jobs returns None."""
-    document = factories.generate_document(tmp_path)
+    document = factories.generate_document(fake_dir)
     fake_uow.documents.add(document)
 
     result = services.get_latest_result_for_document(document.id, fake_uow)
@@ -128,9 +145,9 @@ def test_get_latest_result_for_document_no_results(
     assert result is None
 
 
-def test_get_document_with_latest_result(fake_uow: FakeUnitOfWork, tmp_path: Path):
+def test_get_document_with_latest_result(fake_uow: FakeUnitOfWork, fake_dir: Path):
     """Test getting document with its latest result."""
-    document = factories.generate_document(tmp_path)
+    document = factories.generate_document(fake_dir)
     job = factories.generate_ocr_job()
     job.status = JobStatus.COMPLETED
     job.document_id = document.id
@@ -149,10 +166,10 @@ def test_get_document_with_latest_result(fake_uow: FakeUnitOfWork, tmp_path: Pat
 
 
 def test_get_document_with_latest_result_no_results(
-    fake_uow: FakeUnitOfWork, tmp_path: Path
+    fake_uow: FakeUnitOfWork, fake_dir: Path
 ):
     """Test getting document when it has no completed jobs."""
-    document = factories.generate_document(tmp_path)
+    document = factories.generate_document(fake_dir)
     fake_uow.documents.add(document)
 
     job = factories.generate_ocr_job(status=JobStatus.PENDING)
@@ -167,5 +184,5 @@ def test_get_document_with_latest_result_no_results(
 
 def test_get_document_with_latest_result_document_not_found(fake_uow: FakeUnitOfWork):
     """Test that getting non-existent document raises DocumentNotFoundError."""
-    with pytest.raises(exceptions.DocumentNotFoundError, match="Document .* not found"):
+    with pytest.raises(exceptions.DocumentNotFoundError, match=_DOC_NOT_FOUND_RE):
         services.get_document_with_latest_result("nonexistent-doc", fake_uow)
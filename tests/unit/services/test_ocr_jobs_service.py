@@ -1,14 +1,45 @@
+import re
 import uuid
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from uuid import UUID
 
 import pytest
 
-from kul_ocr.domain.model import JobStatus, FileType
+from kul_ocr.domain.model import Job, JobStatus, FileType
 from kul_ocr.domain import exceptions
 from kul_ocr.service_layer import services
 from tests.fakes.uow import FakeUnitOfWork
 from tests import factories
+from tests.fakes.pool import pooled_job
+
+_DOC_NOT_FOUND_RE = re.compile(r"Document .* not found")
+_JOB_NOT_FOUND_RE = re.compile(r"OCR Job .* not found")
+_ALREADY_PROCESSED_RE = re.compile(r"has already been processed")
+_RETRY_RE = re.compile(r"only failed jobs can be retried")
+
+
+def build_jobs(
+    uow: FakeUnitOfWork, specs: Iterable[tuple[JobStatus, str | None]]
+) -> Sequence[Job]:
+    """Add one job per ``(status, document_id)`` spec to ``uow`` and return them.
+
+    A ``None`` document id gives the job a document of its own.
+    """
+    jobs = [
+        pooled_job(status, document_id=document_id) for status, document_id in specs
+    ]
+    uow.jobs.add_many(jobs)
+    return jobs
+
+
+# 3 pending, 2 processing, 4 completed and 1 failed job.
+_MIXED_STATUS_SPECS: tuple[tuple[JobStatus, str | None], ...] = (
+    *[(JobStatus.PENDING, None)] * 3,
+    *[(JobStatus.PROCESSING, None)] * 2,
+    *[(JobStatus.COMPLETED, None)] * 4,
+    (JobStatus.FAILED, None),
+)
 
 
 # --- get_ocr_jobs_by_status tests ---
@@ -26,15 +57,7 @@ from tests import factories
 def test_get_ocr_jobs_by_status(
     uow: FakeUnitOfWork, status: JobStatus, expected_count: int
 ):
-    all_jobs = (
-        *factories.generate_ocr_jobs(3, status=JobStatus.PENDING),
-        *factories.generate_ocr_jobs(2, status=JobStatus.PROCESSING),
-        *factories.generate_ocr_jobs(4, status=JobStatus.COMPLETED),
-        *factories.generate_ocr_jobs(1, status=JobStatus.FAILED),
-    )
-
-    for job in all_jobs:
-        uow.jobs.add(job)
+    build_jobs(uow, _MIXED_STATUS_SPECS)
 
     jobs_by_status = services.get_ocr_jobs_by_status(status, uow)
     assert len(jobs_by_status) == expected_count
@@ -42,10 +65,7 @@ def test_get_ocr_jobs_by_status(
 
 
 def test_get_ocr_jobs_by_status_empty_when_no_matches(uow: FakeUnitOfWork):
-    all_jobs = (*factories.generate_ocr_jobs(3, status=JobStatus.PENDING),)
-
-    for job in all_jobs:
-        uow.jobs.add(job)
+    build_jobs(uow, [(JobStatus.PENDING, None)] * 3)
 
     jobs_by_status = services.get_ocr_jobs_by_status(JobStatus.COMPLETED, uow)
     assert len(jobs_by_status) == 0
@@ -64,20 +84,15 @@ def test_get_ocr_jobs_by_document_id(uow: FakeUnitOfWork):
     """Test retrieving jobs for a specific document."""
     document_id = "doc-123"
 
-    # Create jobs for the target document
-    target_jobs = [
-        factories.generate_ocr_job(status=JobStatus.PENDING),
-        factories.generate_ocr_job(status=JobStatus.COMPLETED),
-        factories.generate_ocr_job(status=JobStatus.FAILED),
-    ]
-    for job in target_jobs:
-        job.document_id = document_id
-        uow.jobs.add(job)
-
-    # Create jobs for other documents
-    other_jobs = factories.generate_ocr_jobs(5)
-    for job in other_jobs:
-        uow.jobs.add(job)
+    # Jobs for the target document, then jobs for other documents
+    build_jobs(
+        uow,
+        [
+            (status, document_id)
+            for status in (JobStatus.PENDING, JobStatus.COMPLETED, JobStatus.FAILED)
+        ],
+    )
+    build_jobs(uow, [(JobStatus.PENDING, None)] * 5)
 
     # Retrieve jobs for our target document
     jobs = services.get_ocr_jobs_by_document_id(document_id, uow)
@@ -91,8 +106,7 @@ def test_get_ocr_jobs_by_document_id_empty_when_no_matches(uow: FakeUnitOfWork):
     """Test that empty list is returned when document has no jobs."""
     # Add jobs for other documents
     jobs = factories.generate_ocr_jobs(5)
-    for job in jobs:
-        uow.jobs.add(job)
+    uow.jobs.add_many(jobs)
 
     # Query for document that has no jobs
     result = services.get_ocr_jobs_by_document_id("nonexistent-doc", uow)
@@ -105,15 +119,7 @@ def test_get_ocr_jobs_by_document_id_empty_when_no_matches(uow: FakeUnitOfWork):
 
 def test_get_terminal_ocr_jobs(uow: FakeUnitOfWork):
     """Test retrieving only terminal (completed/failed) jobs."""
-    all_jobs = (
-        *factories.generate_ocr_jobs(3, status=JobStatus.PENDING),
-        *factories.generate_ocr_jobs(2, status=JobStatus.PROCESSING),
-        *factories.generate_ocr_jobs(4, status=JobStatus.COMPLETED),
-        *factories.generate_ocr_jobs(1, status=JobStatus.FAILED),
-    )
-
-    for job in all_jobs:
-        uow.jobs.add(job)
+    build_jobs(uow, _MIXED_STATUS_SPECS)
 
     terminal_jobs = services.get_terminal_ocr_jobs(uow)
 
@@ -125,13 +131,7 @@ def test_get_terminal_ocr_jobs(uow: FakeUnitOfWork):
 
 def test_get_terminal_ocr_jobs_empty_when_none_terminal(uow: FakeUnitOfWork):
     """Test that empty list is returned when no terminal jobs exist."""
-    all_jobs = (
-        *factories.generate_ocr_jobs(3, status=JobStatus.PENDING),
-        *factories.generate_ocr_jobs(2, status=JobStatus.PROCESSING),
-    )
-
-    for job in all_jobs:
-        uow.jobs.add(job)
+    build_jobs(uow, _MIXED_STATUS_SPECS[:5])
 
     terminal_jobs = services.get_terminal_ocr_jobs(uow)
 
@@ -141,10 +141,10 @@ def test_get_terminal_ocr_jobs_empty_when_none_terminal(uow: FakeUnitOfWork):
 # --- submit_ocr_job tests ---
 
 
-def test_submit_ocr_job_success(uow: FakeUnitOfWork, tmp_path: Path):
+def test_submit_ocr_job_success(uow: FakeUnitOfWork, fake_dir: Path):
     """Test successfully submitting an OCR job for a document."""
 
-    document = factories.generate_document(tmp_path, file_type=FileType.PDF)
+    document = factories.generate_document(fake_dir, file_type=FileType.PDF)
     uow.documents.add(document)
 
     job = services.submit_ocr_job(document.id, uow)
@@ -160,7 +160,7 @@ def test_submit_ocr_job_success(uow: FakeUnitOfWork, tmp_path: Path):
 
 def test_submit_ocr_job_document_not_found(uow: FakeUnitOfWork):
     """Test that submitting a job for non-existent document raises error."""
-    with pytest.raises(exceptions.DocumentNotFoundError, match="Document .* not found"):
+    with pytest.raises(exceptions.DocumentNotFoundError, match=_DOC_NOT_FOUND_RE):
         _ = services.submit_ocr_job("nonexistent-doc", uow)
 
 
@@ -170,7 +170,7 @@ def test_submit_ocr_job_document_not_found(uow: FakeUnitOfWork):
 def test_start_ocr_job_processing_success(uow: FakeUnitOfWork):
     """Test successfully starting a pending job."""
     # Create a pending job
-    job = factories.generate_ocr_job(status=JobStatus.PENDING)
+    job = pooled_job(JobStatus.PENDING)
     uow.jobs.add(job)
 
     updated_job = services.start_ocr_job_processing(UUID(job.id), uow)
@@ -182,20 +182,18 @@ def test_start_ocr_job_processing_success(uow: FakeUnitOfWork):
 
 def test_start_ocr_job_processing_job_not_found(uow: FakeUnitOfWork):
     """Test that starting non-existent job raises error."""
-    with pytest.raises(exceptions.OCRJobNotFoundError, match="OCR Job .* not found"):
+    with pytest.raises(exceptions.OCRJobNotFoundError, match=_JOB_NOT_FOUND_RE):
         _ = services.start_ocr_job_processing(uuid.uuid4(), uow)
 
 
 def test_start_ocr_job_processing_already_processing(uow: FakeUnitOfWork):
     """Test that starting an already processing job raises error."""
     # Create a job that's already processing
-    job = factories.generate_ocr_job(status=JobStatus.PROCESSING)
+    job = pooled_job(JobStatus.PROCESSING)
     uow.jobs.add(job)
 
     # Attempting to start it again should fail
-    with pytest.raises(
-        exceptions.InvalidJobStatusError, match="has already been processed"
-    ):
+    with pytest.raises(exceptions.InvalidJobStatusError, match=_ALREADY_PROCESSED_RE):
         _ = services.start_ocr_job_processing(UUID(job.id), uow)
 
 
@@ -205,7 +203,7 @@ def test_start_ocr_job_processing_already_processing(uow: FakeUnitOfWork):
 def test_retry_failed_job_success(uow: FakeUnitOfWork):
     """Test successfully retrying a failed job."""
     # Create a failed job
-    failed_job = factories.generate_ocr_job(status=JobStatus.FAILED)
+    failed_job = pooled_job(JobStatus.FAILED)
     failed_job.error_message = "Original error"
     uow.jobs.add(failed_job)
 
@@ -221,7 +219,7 @@ def test_retry_failed_job_success(uow: FakeUnitOfWork):
 
 def test_retry_failed_job_not_found(uow: FakeUnitOfWork):
     """Test that retrying non-existent job raises error."""
-    with pytest.raises(exceptions.OCRJobNotFoundError, match="OCR Job .* not found"):
+    with pytest.raises(exceptions.OCRJobNotFoundError, match=_JOB_NOT_FOUND_RE):
         _ = services.retry_failed_job("nonexistent-job", uow)
 
 
@@ -235,33 +233,29 @@ def test_retry_failed_job_not_found(uow: FakeUnitOfWork):
 )
 def test_retry_failed_job_wrong_status(uow: FakeUnitOfWork, status: JobStatus):
     """Test that retrying a non-failed job raises error."""
-    job = factories.generate_ocr_job(status=status)
+    job = pooled_job(status)
     uow.jobs.add(job)
 
-    with pytest.raises(
-        exceptions.InvalidJobStatusError, match="only failed jobs can be retried"
-    ):
+    with pytest.raises(exceptions.InvalidJobStatusError, match=_RETRY_RE):
         _ = services.retry_failed_job(job.id, uow)
 
 
 # --- get_latest_result_for_document tests ---
 
 
-def test_get_latest_result_for_document_success(uow: FakeUnitOfWork, tmp_path: Path):
+def test_get_latest_result_for_document_success(uow: FakeUnitOfWork, fake_dir: Path):
     """Test getting the latest result for a document with multiple completed jobs."""
-    document = factories.generate_document(tmp_path, file_type=FileType.PDF)
+    document = factories.generate_document(fake_dir, file_type=FileType.PDF)
     uow.documents.add(document)
     document_id = document.id
 
     # Create multiple completed jobs for the same document
-    job1 = factories.generate_ocr_job(status=JobStatus.PENDING)
-    job1.document_id = document_id
+    job1 = pooled_job(JobStatus.PENDING, document_id=document_id)
     job1.mark_as_processing()
     job1.complete()
     uow.jobs.add(job1)
 
-    job2 = factories.generate_ocr_job(status=JobStatus.PENDING)
-    job2.document_id = document_id
+    job2 = pooled_job(JobStatus.PENDING, document_id=document_id)
     job2.mark_as_processing()
     job2.complete()
     uow.jobs.add(job2)
@@ -284,16 +278,15 @@ def test_get_latest_result_for_document_success(uow: FakeUnitOfWork, tmp_path: P
 
 
 def test_get_latest_result_for_document_no_completed_jobs(
-    uow: FakeUnitOfWork, tmp_path: Path
+    uow: FakeUnitOfWork, fake_dir: Path
 ):
     """Test that None is returned when document has no completed jobs."""
-    document = factories.generate_document(tmp_path, file_type=FileType.PDF)
+    document = factories.generate_document(fake_dir, file_type=FileType.PDF)
     uow.documents.add(document)
     document_id = document.id
 
     # Create only pending jobs
-    job = factories.generate_ocr_job(status=JobStatus.PENDING)
-    job.document_id = document_id
+    job = pooled_job(JobStatus.PENDING, document_id=document_id)
     uow.jobs.add(job)
 
     result = services.get_latest_result_for_document(document_id, uow)
@@ -303,5 +296,5 @@ def test_get_latest_result_for_document_no_completed_jobs(
 
 def test_get_latest_result_for_document_document_not_found(uow: FakeUnitOfWork):
     """Test that DocumentNotFoundError is raised when document has no jobs."""
-    with pytest.raises(exceptions.DocumentNotFoundError, match="Document .* not found"):
+    with pytest.raises(exceptions.DocumentNotFoundError, match=_DOC_NOT_FOUND_RE):
         services.get_latest_result_for_document("nonexistent-doc", uow)
@@ -16,8 +16,9 @@ def mock_document_loader():
     return Mock(spec=ports.DocumentLoader)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_image():
+    """Shared across tests: the mocks only compare it by identity, never mutate it."""
     return Image.new("RGB", (10, 10), color="white")
 
 
@@ -36,7 +37,7 @@ def test_process_document_orchestration(
             image=sample_image, page_number=1, original_document_id="doc1"
         )
     ]
-    mock_ocr_engine.process_image.return_value = "extracted text"
+    mock_ocr_engine.process_images.return_value = ["extracted text"]
 
     # Act
     result = services.process_document(
@@ -51,7 +52,7 @@ def test_process_document_orchestration(
     assert len(result.content) == 1
     assert result.content[0].result.full_text == "extracted text"
     mock_document_loader.load_pages.assert_called_once_with(doc_input)
-    mock_ocr_engine.process_image.assert_called_once_with(sample_image)
+    mock_ocr_engine.process_images.assert_called_once_with([sample_image])
 
 
 def test_process_document_multi_page_orchestration(
@@ -72,7 +73,7 @@ def test_process_document_multi_page_orchestration(
             image=sample_image, page_number=2, original_document_id="doc2"
         ),
     ]
-    mock_ocr_engine.process_image.side_effect = ["text 1", "text 2"]
+    mock_ocr_engine.process_images.return_value = ["text 1", "text 2"]
 
     # Act
     result = services.process_document(
@@ -86,7 +87,43 @@ def test_process_document_multi_page_orchestration(
     assert len(result.content) == 2
     assert result.content[0].result.full_text == "text 1"
     assert result.content[1].result.full_text == "text 2"
-    assert mock_ocr_engine.process_image.call_count == 2
+    mock_ocr_engine.process_images.assert_called_once_with([sample_image, sample_image])
+
+
+def test_process_document_batches_pages_lazily(
+    mock_ocr_engine, mock_document_loader, sample_image, monkeypatch
+):
+    monkeypatch.setattr(services, "OCR_BATCH_SIZE", 2)
+    doc_input = structs.DocumentInput(
+        id="doc4",
+        file_path="doc4.pdf",
+        file_type=model.FileType.PDF,
+    )
+    mock_document_loader.load_pages.return_value = (
+        structs.PageInput(
+            image=sample_image, page_number=n, original_document_id="doc4"
+        )
+        for n in range(1, 4)
+    )
+    mock_ocr_engine.process_images.side_effect = lambda images: [
+        f"text {len(images)}" for _ in images
+    ]
+
+    result = services.process_document(
+        doc_input=doc_input,
+        ocr_engine=mock_ocr_engine,
+        document_loader=mock_document_loader,
+    )
+
+    batch_sizes = [
+        len(call.args[0]) for call in mock_ocr_engine.process_images.call_args_list
+    ]
+    assert batch_sizes == [2, 1]
+    assert [page.result.full_text for page in result.content] == [
+        "text 2",
+        "text 2",
+        "text 1",
+    ]
 
 
 def test_process_document_raises_if_no_pages(mock_ocr_engine, mock_document_loader):
@@ -105,3 +142,4 @@ def test_process_document_raises_if_no_pages(mock_ocr_engine, mock_document_load
             ocr_engine=mock_ocr_engine,
             document_loader=mock_document_loader,
         )
+    mock_ocr_engine.process_images.assert_not_called()
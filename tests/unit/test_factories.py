@@ -1,81 +1,100 @@
-from collections.abc import Sequence
+import types
+import typing
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
-
-from kul_ocr.domain import model
-from tests import factories
+import pytest
+
+from kul_ocr.domain.model import (
+    Document,
+    FileType,
+    Job,
+    JobStatus,
+    PagePart,
+    ProcessedPage,
+    Result,
+    TextPart,
+)
+from tests.factories import (
+    generate_document,
+    generate_documents,
+    generate_ocr_job,
+    generate_ocr_jobs,
+    generate_ocr_result,
+    generate_ocr_results,
+    generate_page_part,
+    generate_processed_page,
+    generate_text_part,
+)
+
+_JOB_STATUSES = tuple(JobStatus)
+_FILE_TYPES = tuple(FileType)
+
+
+def _assert_shape(obj: object, cls: type) -> None:
+    """Assert ``obj`` is a ``cls`` whose fields all match their annotated types."""
+    assert isinstance(obj, cls)
+    for name, hint in typing.get_type_hints(cls).items():
+        value = getattr(obj, name)
+        origin = typing.get_origin(hint)
+        if origin is typing.Literal:
+            assert value in typing.get_args(hint), name
+        elif origin is None or origin is types.UnionType:
+            assert isinstance(value, hint), name
+        else:  # parametrized generic such as Sequence[TextPart]
+            assert isinstance(value, origin), name
 
 
 class TestGenerateOCRJob:
     """Tests for generate_ocr_job factory."""
 
     def test_generates_job_with_pending_status_by_default(self):
-        job = factories.generate_ocr_job()
+        job = generate_ocr_job()
 
-        assert isinstance(job, model.Job)
-        assert job.status == model.JobStatus.PENDING
-        assert isinstance(job.id, str)
+        _assert_shape(job, Job)
+        assert job.status == JobStatus.PENDING
         assert len(job.id) > 0
-        assert isinstance(job.document_id, str)
         assert len(job.document_id) > 0
 
-    def test_generates_job_with_specified_status(self):
-        job = factories.generate_ocr_job(status=model.JobStatus.COMPLETED)
-
-        assert job.status == model.JobStatus.COMPLETED
-
-    def test_generates_job_with_processing_status(self):
-        job = factories.generate_ocr_job(status=model.JobStatus.PROCESSING)
-
-        assert job.status == model.JobStatus.PROCESSING
+    @pytest.mark.parametrize("status", _JOB_STATUSES, ids=lambda s: s.name)
+    def test_generates_job_with_specified_status(self, status: JobStatus):
+        job = generate_ocr_job(status=status)
 
-    def test_generates_job_with_failed_status(self):
-        job = factories.generate_ocr_job(status=model.JobStatus.FAILED)
+        assert job.status == status
 
-        assert job.status == model.JobStatus.FAILED
-
-    def test_generates_unique_job_ids(self):
-        job1 = factories.generate_ocr_job()
-        job2 = factories.generate_ocr_job()
+    def test_generates_job_with_random_status_when_none(self):
+        job = generate_ocr_job(status=None)
 
-        assert job1.id != job2.id
-        assert job1.document_id != job2.document_id
+        assert job.status in _JOB_STATUSES
 
-    def test_generates_job_with_random_status_when_none(self):
-        job = factories.generate_ocr_job(status=None)
 
-        assert job.status in list(model.JobStatus)
+@pytest.fixture(scope="class")
+def default_jobs() -> Sequence[Job]:
+    """Built once per test class; tests only read it."""
+    return generate_ocr_jobs()
 
 
+# Classes sharing a class-scoped list stay on one xdist worker so it is built once.
+@pytest.mark.xdist_group(name="factory_jobs")
 class TestGenerateOCRJobs:
     """Tests for generate_ocr_jobs factory."""
 
-    def test_generates_default_count_of_jobs(self):
-        jobs = factories.generate_ocr_jobs()
-
-        assert len(jobs) == 10
-        assert all(isinstance(job, model.Job) for job in jobs)
+    def test_generates_default_count_of_jobs(self, default_jobs: Sequence[Job]):
+        assert len(default_jobs) == 10
+        assert all(isinstance(job, Job) for job in default_jobs)
 
     def test_generates_specified_count_of_jobs(self):
-        jobs = factories.generate_ocr_jobs(jobs_count=5)
+        jobs = generate_ocr_jobs(jobs_count=5)
 
         assert len(jobs) == 5
 
     def test_generates_jobs_with_specified_status(self):
-        jobs = factories.generate_ocr_jobs(
-            jobs_count=3, status=model.JobStatus.COMPLETED
-        )
-
-        assert all(job.status == model.JobStatus.COMPLETED for job in jobs)
+        jobs = generate_ocr_jobs(jobs_count=3, status=JobStatus.COMPLETED)
 
-    def test_generates_jobs_with_unique_ids(self):
-        jobs = factories.generate_ocr_jobs(jobs_count=20)
-        job_ids = [job.id for job in jobs]
-
-        assert len(job_ids) == len(set(job_ids))
+        assert all(job.status == JobStatus.COMPLETED for job in jobs)
 
     def test_generates_empty_list_when_count_is_zero(self):
-        jobs = factories.generate_ocr_jobs(jobs_count=0)
+        jobs = generate_ocr_jobs(jobs_count=0)
 
         assert len(jobs) == 0
 
@@ -83,81 +102,59 @@ class TestGenerateOCRJobs:
 class TestGenerateDocument:
     """Tests for generate_document factory."""
 
-    def test_generates_document_with_random_file_type(self, tmp_path: Path):
-        document = factories.generate_document(dir_path=tmp_path)
+    def test_generates_document_with_random_file_type(self, fake_dir: Path):
+        document = generate_document(dir_path=fake_dir)
 
-        assert isinstance(document, model.Document)
-        assert isinstance(document.id, str)
+        _assert_shape(document, Document)
         assert len(document.id) > 0
-        assert document.file_type in list(model.FileType)
         assert document.file_size_bytes == 0
-        assert str(tmp_path) in document.file_path
-
-    def test_generates_document_with_specified_file_type(self, tmp_path: Path):
-        document = factories.generate_document(
-            dir_path=tmp_path, file_type=model.FileType.PDF
-        )
+        assert str(fake_dir) in document.file_path
 
-        assert document.file_type == model.FileType.PDF
-
-    def test_generates_document_with_specified_file_size(self, tmp_path: Path):
-        document = factories.generate_document(
-            dir_path=tmp_path, file_size_in_bytes=1024
-        )
+    def test_generates_document_with_specified_file_size(self, fake_dir: Path):
+        document = generate_document(dir_path=fake_dir, file_size_in_bytes=1024)
 
         assert document.file_size_bytes == 1024
 
-    def test_generates_document_with_unique_ids(self, tmp_path: Path):
-        doc1 = factories.generate_document(dir_path=tmp_path)
-        doc2 = factories.generate_document(dir_path=tmp_path)
+    @pytest.mark.parametrize("file_type", _FILE_TYPES, ids=lambda f: f.name)
+    def test_generates_document_with_each_file_type(
+        self, fake_dir: Path, file_type: FileType
+    ):
+        document = generate_document(dir_path=fake_dir, file_type=file_type)
 
-        assert doc1.id != doc2.id
-        assert doc1.file_path != doc2.file_path
+        assert document.file_type == file_type
+        assert document.file_path.endswith(file_type.dot_extension)
 
-    def test_generates_document_with_all_file_types(self, tmp_path: Path):
-        for file_type in model.FileType:
-            document = factories.generate_document(
-                dir_path=tmp_path, file_type=file_type
-            )
 
-            assert document.file_type == file_type
+@pytest.fixture(scope="class")
+def default_documents(fake_dir: Path) -> Sequence[Document]:
+    """Built once per test class; tests only read it."""
+    return generate_documents(dir_path=fake_dir)
 
 
+@pytest.mark.xdist_group(name="factory_documents")
 class TestGenerateDocuments:
     """Tests for generate_documents factory."""
 
-    def test_generates_default_count_of_documents(self, tmp_path: Path):
-        documents = factories.generate_documents(dir_path=tmp_path)
+    def test_generates_default_count_of_documents(
+        self, default_documents: Sequence[Document]
+    ):
+        assert len(default_documents) == 10
+        assert all(isinstance(doc, Document) for doc in default_documents)
 
-        assert len(documents) == 10
-        assert all(isinstance(doc, model.Document) for doc in documents)
-
-    def test_generates_specified_count_of_documents(self, tmp_path: Path):
-        documents = factories.generate_documents(dir_path=tmp_path, documents_count=5)
+    def test_generates_specified_count_of_documents(self, fake_dir: Path):
+        documents = generate_documents(dir_path=fake_dir, documents_count=5)
 
         assert len(documents) == 5
 
-    def test_generates_documents_with_specified_file_type(self, tmp_path: Path):
-        documents = factories.generate_documents(
-            dir_path=tmp_path, documents_count=3, file_type=model.FileType.PNG
+    def test_generates_documents_with_specified_file_type(self, fake_dir: Path):
+        documents = generate_documents(
+            dir_path=fake_dir, documents_count=3, file_type=FileType.PNG
         )
 
-        assert all(doc.file_type == model.FileType.PNG for doc in documents)
-
-    def test_generates_documents_with_unique_ids(self, tmp_path: Path):
-        documents = factories.generate_documents(dir_path=tmp_path, documents_count=15)
-        doc_ids = [doc.id for doc in documents]
-
-        assert len(doc_ids) == len(set(doc_ids))
-
-    def test_generates_documents_with_unique_file_paths(self, tmp_path: Path):
-        documents = factories.generate_documents(dir_path=tmp_path, documents_count=15)
-        file_paths = [doc.file_path for doc in documents]
-
-        assert len(file_paths) == len(set(file_paths))
+        assert all(doc.file_type == FileType.PNG for doc in documents)
 
-    def test_generates_empty_list_when_count_is_zero(self, tmp_path: Path):
-        documents = factories.generate_documents(dir_path=tmp_path, documents_count=0)
+    def test_generates_empty_list_when_count_is_zero(self, fake_dir: Path):
+        documents = generate_documents(dir_path=fake_dir, documents_count=0)
 
         assert len(documents) == 0
 
@@ -166,17 +163,13 @@ class TestGenerateTextPart:
     """Tests for generate_text_part factory."""
 
     def test_generates_text_part(self):
-        text_part = factories.generate_text_part()
+        text_part = generate_text_part()
 
-        assert isinstance(text_part, model.TextPart)
-        assert isinstance(text_part.text, str)
-        assert isinstance(text_part.bbox, model.BoundingBox)
-        assert isinstance(text_part.level, str)
-        assert text_part.level in ["word", "line", "block"]
+        _assert_shape(text_part, TextPart)
 
     def test_generates_unique_text_parts(self):
-        text_part1 = factories.generate_text_part()
-        text_part2 = factories.generate_text_part()
+        text_part1 = generate_text_part()
+        text_part2 = generate_text_part()
 
         assert text_part1.text != text_part2.text
 
@@ -185,15 +178,13 @@ class TestGeneratePagePart:
     """Tests for generate_page_part factory."""
 
     def test_generates_page_part(self):
-        page_part = factories.generate_page_part()
+        page_part = generate_page_part()
 
-        assert isinstance(page_part, model.PagePart)
-        assert isinstance(page_part.parts, Sequence)
+        _assert_shape(page_part, PagePart)
         assert len(page_part.parts) >= 1
-        assert isinstance(page_part.metadata, model.PageMetadata)
 
     def test_generates_page_part_with_custom_dimensions(self):
-        page_part = factories.generate_page_part(width=800, height=1000)
+        page_part = generate_page_part(width=800, height=1000)
 
         assert page_part.metadata.width == 800
         assert page_part.metadata.height == 1000
@@ -203,80 +194,88 @@ class TestGenerateProcessedPage:
     """Tests for generate_processed_page factory."""
 
     def test_generates_processed_page(self):
-        processed_page = factories.generate_processed_page()
+        processed_page = generate_processed_page()
 
-        assert isinstance(processed_page, model.ProcessedPage)
-        assert isinstance(processed_page.ref, model.PageRef)
-        assert isinstance(processed_page.result, model.PagePart)
+        _assert_shape(processed_page, ProcessedPage)
 
 
 class TestGenerateOCRResult:
     """Tests for generate_ocr_result factory."""
 
     def test_generates_result(self):
-        result = factories.generate_ocr_result()
+        result = generate_ocr_result()
 
-        assert isinstance(result, model.Result)
-        assert isinstance(result.id, str)
-        assert isinstance(result.job_id, str)
-        assert isinstance(result.content, Sequence)
+        _assert_shape(result, Result)
         assert len(result.content) >= 1
 
-    def test_generates_result_with_single_page(self):
-        result = factories.generate_ocr_result(pages_count=1)
+    @pytest.mark.parametrize(
+        "ocr_result,pages_count", [(1, 1), (5, 5)], indirect=["ocr_result"]
+    )
+    def test_generates_result_with_page_count(
+        self, ocr_result: Result, pages_count: int
+    ):
+        indexes = [page.ref.index for page in ocr_result.content]
 
-        assert len(result.content) == 1
-        assert result.content[0].ref.index == 0
-
-    def test_generates_result_with_multiple_pages(self):
-        result = factories.generate_ocr_result(pages_count=5)
-
-        assert len(result.content) == 5
-        for i, page in enumerate(result.content):
-            assert page.ref.index == i
+        assert indexes == list(range(pages_count))
 
     def test_generates_result_with_specified_document_id(self):
         doc_id = "custom-doc-id-123"
-        result = factories.generate_ocr_result(document_id=doc_id)
+        result = generate_ocr_result(document_id=doc_id)
+
+        document_ids = [page.ref.document_id for page in result.content]
 
-        assert result.content[0].ref.document_id == doc_id
-        assert all(page.ref.document_id == doc_id for page in result.content)
+        assert document_ids == [doc_id] * len(document_ids)
 
-    def test_generates_results_with_unique_ids(self):
-        result1 = factories.generate_ocr_result()
-        result2 = factories.generate_ocr_result()
 
-        assert result1.id != result2.id
+@pytest.fixture(scope="class")
+def default_results() -> Sequence[Result]:
+    """Built once per test class; tests only read it."""
+    return generate_ocr_results()
 
 
+@pytest.mark.xdist_group(name="factory_results")
 class TestGenerateOCRResults:
     """Tests for generate_ocr_results factory."""
 
-    def test_generates_default_count_of_results(self):
-        results = factories.generate_ocr_results()
-
-        assert len(results) == 10
-        assert all(isinstance(result, model.Result) for result in results)
+    def test_generates_default_count_of_results(
+        self, default_results: Sequence[Result]
+    ):
+        assert len(default_results) == 10
+        assert all(isinstance(result, Result) for result in default_results)
 
     def test_generates_specified_count_of_results(self):
-        results = factories.generate_ocr_results(results_count=5)
+        results = generate_ocr_results(results_count=5)
 
         assert len(results) == 5
 
-    def test_generates_results_with_unique_ids(self):
-        results = factories.generate_ocr_results(results_count=20)
-        result_ids = [r.id for r in results]
-
-        assert len(result_ids) == len(set(result_ids))
-
     def test_generates_empty_list_when_count_is_zero(self):
-        results = factories.generate_ocr_results(results_count=0)
+        results = generate_ocr_results(results_count=0)
 
         assert len(results) == 0
 
-    def test_all_results_have_different_job_ids(self):
-        results = factories.generate_ocr_results(results_count=5)
-        job_ids = [r.job_id for r in results]
 
-        # Each result should have its own job_id
-        assert len(job_ids) == len(set(job_ids))
+@pytest.mark.parametrize(
+    "build,attr,count",
+    [
+        pytest.param(lambda _, n: generate_ocr_jobs(n), "id", 1000, id="job-id"),
+        pytest.param(
+            lambda _, n: generate_ocr_jobs(n), "document_id", 1000, id="job-document_id"
+        ),
+        pytest.param(generate_documents, "id", 1000, id="document-id"),
+        pytest.param(generate_documents, "file_path", 1000, id="document-file_path"),
+        pytest.param(lambda _, n: generate_ocr_results(n), "id", 100, id="result-id"),
+        pytest.param(
+            lambda _, n: generate_ocr_results(n), "job_id", 100, id="result-job_id"
+        ),
+    ],
+)
+def test_factories_generate_unique_values(
+    fake_dir: Path,
+    build: Callable[[Path, int], Sequence[object]],
+    attr: str,
+    count: int,
+):
+    """One large batch per factory; every generated value must be distinct."""
+    items = build(fake_dir, count)
+
+    assert len({getattr(item, attr) for item in items}) == count